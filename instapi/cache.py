@@ -1,15 +1,41 @@
-from collections import deque
-from contextvars import ContextVar
-from dataclasses import dataclass
+import asyncio
+import inspect
+import pickle
+import sqlite3
+import sys
+import threading
+import zlib
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass, field, replace
 from functools import partial, wraps
 from hashlib import md5
+from inspect import Parameter, Signature
 from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from time import time
-from typing import Any, Callable, Deque, Dict, Optional, Tuple, TypeVar
+from time import perf_counter, time
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+from weakref import WeakSet
 
 from instagram_private_api.http import ClientCookieJar
 
+from instapi.storage import SQLiteStorage
 from instapi.types import Credentials
 
 
@@ -46,53 +72,740 @@ def write_to_cache(credentials: Credentials, cookie: ClientCookieJar) -> None:
 
 CACHED_TIME = ContextVar("CACHED_TIME", default=60)
 CacheKey = Tuple[Tuple, Tuple]
+ErrorsFilter = Union[
+    Type[BaseException],
+    Tuple[Type[BaseException], ...],
+    Callable[[BaseException], bool],
+]
+
+_POSITIONAL_KINDS = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
 
 T = TypeVar("T")
 
 
+def _get_size(obj: Any, seen: Optional[Set[int]] = None) -> int:
+    """
+    Roughly estimate how many bytes object and all objects it refers to take
+
+    :param obj: object to measure
+    :param seen: ids of objects that were already measured
+    :return: estimated size in bytes
+    """
+    seen = set() if seen is None else seen
+
+    if id(obj) in seen:
+        return 0
+
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        size += sum(_get_size(k, seen) + _get_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(_get_size(item, seen) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += _get_size(vars(obj), seen)
+
+    return size
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    expires: float
+    size: int = 0
+    # Time when entry should be deleted, can be later than expires for stale entries
+    deadline: float = 0
+    error: bool = False
+
+    def result(self) -> Any:
+        if self.error:
+            raise self.value.with_traceback(None)
+
+        return self.value
+
+
+class _Call(Future):
+    """
+    Result of function call that is in progress
+    """
+
+    def __init__(self, owner: Optional[int]) -> None:
+        super().__init__()
+        # Thread that calculates value, background calls get it when worker starts them
+        self.owner = owner
+
+
+# Upper bounds of miss latency histogram buckets in seconds
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+
+@dataclass
+class CacheStats:
+    """
+    Statistics of cached function, latency contains count of misses
+    for each bucket from LATENCY_BUCKETS
+    """
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    size: int = 0
+    latency: List[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+
+    @property
+    def hit_rate(self) -> float:
+        hits = self.hits + self.stale_hits
+        total = hits + self.misses
+        return hits / total if total else 0.0
+
+    def add_latency(self, latency: float) -> None:
+        self.latency[bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def copy(self) -> "CacheStats":
+        return replace(self, latency=[*self.latency])
+
+
 @dataclass
 class _CacheInfo:
-    cache: Dict[CacheKey, Any]
+    cache: "OrderedDict[CacheKey, _CacheEntry]"
     keys: Deque[Tuple[CacheKey, float]]
+    max_entries: Optional[int] = None
+    max_bytes: Optional[int] = None
+    stale_ttl: float = 0
+    calls: Dict[CacheKey, Any] = field(default_factory=dict)
+    stats: CacheStats = field(default_factory=CacheStats)
+
+
+class _Cache:
+    """
+    LRU storage for results of cached function.
+    Entries are dropped when they are expired or when cache
+    exceeds max_entries/max_bytes limits, least recently used go first.
+    Calls that are in progress are kept at calls, so concurrent
+    calls with same key can wait for the result instead of calling function again.
+    Expired entries are kept for stale_ttl seconds more, so they can be
+    returned while new value is calculated.
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        stale_ttl: float = 0,
+    ) -> None:
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries should be positive number")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes should be positive number")
+        if stale_ttl < 0:
+            raise ValueError("stale_ttl can't be negative number")
+
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_ttl = stale_ttl
+        self.total_bytes = 0
+        self.stats = CacheStats()
+
+        self.cache: "OrderedDict[CacheKey, _CacheEntry]" = OrderedDict()
+        self.keys: Deque[Tuple[CacheKey, float]] = deque()
+
+        # Guards cache and calls, all other methods expect that lock is acquired
+        self.lock = threading.RLock()
+        self.calls: Dict[CacheKey, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self.cache
+
+    def _delete(self, key: CacheKey) -> None:
+        entry = self.cache.pop(key)
+        self.total_bytes -= entry.size
+
+    def clear(self) -> None:
+        with self.lock:
+            self.cache.clear()
+            self.keys.clear()
+            self.total_bytes = 0
+
+    def delete_expired(self) -> None:
+        now = time()
+
+        while self.keys:
+            key, deadline = self.keys[0]
+
+            if deadline > now:
+                break
+
+            self.keys.popleft()
+
+            # Key can be already evicted or re-added with new expiration time
+            entry = self.cache.get(key)
+            if entry is not None and entry.deadline == deadline:
+                self._delete(key)
+                self.stats.expirations += 1
+
+    def _is_full(self) -> bool:
+        if self.max_entries is not None and len(self.cache) > self.max_entries:
+            return True
+
+        return self.max_bytes is not None and self.total_bytes > self.max_bytes
+
+    def get(self, key: CacheKey) -> _CacheEntry:
+        entry = self.cache[key]
+        now = time()
+
+        if entry.deadline <= now:
+            self._delete(key)
+            self.stats.expirations += 1
+            raise KeyError(key)
+
+        self.cache.move_to_end(key)
+
+        if entry.expires <= now:
+            self.stats.stale_hits += 1
+        else:
+            self.stats.hits += 1
+
+        return entry
+
+    def set(self, key: CacheKey, value: Any, ttl: float, error: bool = False) -> None:
+        if key in self.cache:
+            self._delete(key)
+
+        expires = time() + ttl
+        # Errors should not be returned when they are expired
+        entry = _CacheEntry(
+            value,
+            expires,
+            deadline=expires + (0 if error else self.stale_ttl),
+            error=error,
+        )
+
+        if self.max_bytes is not None:
+            entry.size = _get_size(key) + _get_size(value)
+
+        self.cache[key] = entry
+        self.keys.append((key, entry.deadline))
+        self.total_bytes += entry.size
+
+        while self.cache and self._is_full():
+            self._delete(next(iter(self.cache)))
+            self.stats.evictions += 1
+
+        # Evicted and overwritten entries stay at keys until their deadline,
+        # so keys are compacted to keep them bounded by cache size
+        if len(self.keys) > 2 * len(self.cache):
+            self._compact_keys()
+
+    def _compact_keys(self) -> None:
+        self.keys = deque(
+            (key, deadline)
+            for key, deadline in self.keys
+            if key in self.cache and self.cache[key].deadline == deadline
+        )
+
+    def get_stats(self) -> CacheStats:
+        with self.lock:
+            stats = self.stats.copy()
+            stats.size = len(self.cache)
 
+        return stats
 
+    def info(self) -> _CacheInfo:
+        return _CacheInfo(
+            self.cache,
+            self.keys,
+            self.max_entries,
+            self.max_bytes,
+            self.stale_ttl,
+            self.calls,
+            self.get_stats(),
+        )
+
+
+_CACHES: "WeakSet[_Cache]" = WeakSet()
+
+
+_REVALIDATE_WORKERS = 4
+_revalidate_executor: Optional[ThreadPoolExecutor] = None
+_revalidate_executor_lock = threading.Lock()
+
+
+def _get_revalidate_executor() -> ThreadPoolExecutor:
+    global _revalidate_executor
+
+    with _revalidate_executor_lock:
+        if _revalidate_executor is None:
+            _revalidate_executor = ThreadPoolExecutor(
+                _REVALIDATE_WORKERS,
+                thread_name_prefix="instapi-cache",
+            )
+
+    return _revalidate_executor
+
+
+def cache_stats() -> Dict[str, CacheStats]:
+    """
+    Collect statistics of all cached functions
+
+    :return: mapping from function name to its cache statistics
+    """
+    return {cache.name: cache.get_stats() for cache in [*_CACHES]}
+
+
+def _persistent_key(obj: Any) -> Any:
+    """
+    Replace entities at cache key with their type and pk, entities are equal
+    when pks are equal, so other fields should not change on-disk key
+
+    :param obj: cache key or its part
+    :return: object to build on-disk key from
+    """
+    from instapi.models.base import Entity
+
+    if isinstance(obj, Entity):
+        return f"{type(obj).__module__}.{type(obj).__qualname__}", obj.pk
+    if isinstance(obj, tuple):
+        return tuple(_persistent_key(item) for item in obj)
+
+    return obj
+
+
+class _SQLiteCache(SQLiteStorage):
+    """
+    On-disk storage for results of cached functions, shared by all
+    processes that use same cache root. Values are stored as compressed pickles,
+    so only results of trusted code should be put into it.
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_expires ON cache (expires)")
+
+    @staticmethod
+    def _get_key(namespace: str, key: CacheKey) -> str:
+        data = pickle.dumps(_persistent_key(key), pickle.HIGHEST_PROTOCOL)
+        return md5(namespace.encode() + data).hexdigest()
+
+    def get(self, namespace: str, key: CacheKey) -> _CacheEntry:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value, expires FROM cache WHERE key = ? AND expires > ?",
+                (self._get_key(namespace, key), time()),
+            )
+            .fetchone()
+        )
+
+        if row is None:
+            raise KeyError(key)
+
+        value, expires = row
+        return _CacheEntry(pickle.loads(zlib.decompress(value)), expires)
+
+    def set(self, namespace: str, key: CacheKey, value: Any, ttl: float) -> None:
+        now = time()
+        data = zlib.compress(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+        with self._connection() as conn:
+            conn.execute("DELETE FROM cache WHERE expires <= ?", (now,))
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+                (self._get_key(namespace, key), data, now + ttl),
+            )
+
+    def clear(self) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM cache")
+
+
+_PERSISTENT_CACHE: Optional[_SQLiteCache] = None
+_PERSISTENT_ERRORS = (
+    pickle.PickleError,
+    zlib.error,
+    sqlite3.Error,
+    AttributeError,
+    ImportError,
+    TypeError,
+)
+
+
+def enable_persistent_cache(path: Optional[Path] = None) -> None:
+    """
+    Turn on on-disk cache for functions decorated with @cached(persistent=True)
+
+    :param path: path to sqlite database, by default it's located at cache root
+    :return: None
+    """
+    global _PERSISTENT_CACHE
+    _PERSISTENT_CACHE = _SQLiteCache(path or _CACHE_ROOT / "cache.sqlite3")
+
+
+def disable_persistent_cache() -> None:
+    """
+    Turn off on-disk cache
+
+    :return: None
+    """
+    global _PERSISTENT_CACHE
+    _PERSISTENT_CACHE = None
+
+
+@overload
 def cached(func: Callable[..., T]) -> Callable[..., T]:
-    cache: Dict[CacheKey, Any] = {}
-    keys: Deque[Tuple[CacheKey, float]] = deque()
+    pass  # pragma: no cover
+
+
+@overload
+def cached(
+    *,
+    max_entries: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    persistent: bool = False,
+    ttl: Optional[float] = None,
+    stale_ttl: Optional[float] = None,
+    cache_errors: Optional[ErrorsFilter] = None,
+    errors_ttl: Optional[float] = None,
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    pass  # pragma: no cover
+
+
+def cached(
+    func: Optional[Callable[..., T]] = None,
+    *,
+    max_entries: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    persistent: bool = False,
+    ttl: Optional[float] = None,
+    stale_ttl: Optional[float] = None,
+    cache_errors: Optional[ErrorsFilter] = None,
+    errors_ttl: Optional[float] = None,
+) -> Any:
+    """
+    Cache function results for ttl seconds, CACHED_TIME is used when ttl is not set.
+    Can be used as @cached or @cached(max_entries=..., max_bytes=...),
+    when cache is full least recently used results are dropped first.
+    Wrapper is thread-safe, when multiple threads call it with same arguments
+    only one of them calls function, others wait for its result or exception.
+    Coroutine functions are also supported, awaited result is cached
+    and concurrent tasks with same arguments share one call.
+    Arguments are bound to function signature, so f(1), f(a=1) and f() for
+    def f(a=1) share same cache entry.
+    When stale_ttl is set, result that is expired less than stale_ttl seconds ago
+    is returned immediately and new value is calculated in background.
+    Exceptions that match cache_errors are cached for errors_ttl seconds
+    and raised again for calls with same arguments.
+
+    :param func: function to cache
+    :param max_entries: max count of cached results
+    :param max_bytes: max estimated size of cached results
+    :param persistent: store results at on-disk cache if it's enabled
+    :param ttl: time in seconds during which result is valid
+    :param stale_ttl: time in seconds during which expired result can be returned
+    :param cache_errors: exception types or predicate that selects exceptions to cache
+    :param errors_ttl: time in seconds during which exception is cached, ttl by default
+    :return: wrapped function
+    """
+    if func is None:
+        return partial(
+            cached,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            persistent=persistent,
+            ttl=ttl,
+            stale_ttl=stale_ttl,
+            cache_errors=cache_errors,
+            errors_ttl=errors_ttl,
+        )
+
+    if ttl is not None and ttl <= 0:
+        raise ValueError("ttl should be positive number")
+    if errors_ttl is not None and errors_ttl <= 0:
+        raise ValueError("errors_ttl should be positive number")
+
+    namespace = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', func)}"
+    cache = _Cache(
+        namespace,
+        max_entries=max_entries,
+        max_bytes=max_bytes,
+        stale_ttl=stale_ttl or 0,
+    )
+    _CACHES.add(cache)
+
+    try:
+        signature: Optional[Signature] = inspect.signature(func)
+    except (TypeError, ValueError):  # pragma: no cover
+        signature = None
+
+    # When all arguments are passed as positional there is no need to bind them
+    positional_count = (
+        len(signature.parameters)
+        if signature is not None
+        and all(p.kind in _POSITIONAL_KINDS for p in signature.parameters.values())
+        else -1
+    )
+
+    def _make_key(args: Tuple, kwargs: Dict[str, Any]) -> CacheKey:
+        if not kwargs and len(args) == positional_count:
+            return args, ()
+
+        key = args, tuple(sorted(kwargs.items(), key=itemgetter(0)))
+
+        if signature is None:
+            return key
+
+        try:
+            bound = signature.bind(*args, **kwargs)
+        except TypeError:
+            return key
+
+        bound.apply_defaults()
+        normalized = bound.args, tuple(sorted(bound.kwargs.items(), key=itemgetter(0)))
+
+        try:
+            hash(normalized)
+        except TypeError:
+            # Unhashable default value, call is cached by passed arguments only
+            return key
+
+        return normalized
+
+    def _get_persistent(key: CacheKey) -> _CacheEntry:
+        if not persistent or _PERSISTENT_CACHE is None:
+            raise KeyError(key)
+
+        try:
+            entry = _PERSISTENT_CACHE.get(namespace, key)
+        except _PERSISTENT_ERRORS:
+            raise KeyError(key)
+
+        with cache.lock:
+            cache.set(key, entry.value, entry.expires - time())
+            cache.stats.hits += 1
+
+        return entry
+
+    def _get_ttl() -> float:
+        return CACHED_TIME.get() if ttl is None else ttl
+
+    def _set(key: CacheKey, value: Any, latency: float) -> None:
+        with cache.lock:
+            cache.set(key, value, _get_ttl())
+            cache.stats.add_latency(latency)
+
+        if not persistent or _PERSISTENT_CACHE is None:
+            return
+
+        try:
+            _PERSISTENT_CACHE.set(namespace, key, value, _get_ttl())
+        except _PERSISTENT_ERRORS:
+            # Value can't be stored, so keep it only in memory
+            pass
+
+    def _is_cached_error(error: BaseException) -> bool:
+        if cache_errors is None:
+            return False
+        if isinstance(cache_errors, (type, tuple)):
+            return isinstance(error, cache_errors)
+
+        return cache_errors(error)
+
+    def _set_error(key: CacheKey, error: BaseException) -> None:
+        if not _is_cached_error(error):
+            return
+
+        with cache.lock:
+            cache.set(key, error, _get_ttl() if errors_ttl is None else errors_ttl, error=True)
 
-    def _delete_expired_keys() -> None:  # pragma: no cover
-        while keys:
-            key, expired = keys[0]
+    def _get(key: CacheKey) -> _CacheEntry:
+        with cache.lock:
+            cache.delete_expired()
+            return cache.get(key)
 
-            if expired > time():
-                break
+    def _call(key: CacheKey, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return _get_persistent(key).value
+        except KeyError:
+            pass
+
+        with cache.lock:
+            cache.stats.misses += 1
 
-            keys.popleft()
-            del cache[key]
+        start = perf_counter()
 
-    def _add_key(key: CacheKey) -> None:
-        keys.append((key, time() + CACHED_TIME.get()))
+        try:
+            value = func(*args, **kwargs)
+        except BaseException as e:
+            _set_error(key, e)
+            raise
+
+        _set(key, value, perf_counter() - start)
+
+        return value
+
+    async def _async_call(key: CacheKey, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return _get_persistent(key).value
+        except KeyError:
+            pass
+
+        with cache.lock:
+            cache.stats.misses += 1
+
+        start = perf_counter()
+
+        try:
+            value = await func(*args, **kwargs)  # type: ignore
+        except BaseException as e:
+            _set_error(key, e)
+            raise
+
+        _set(key, value, perf_counter() - start)
+
+        return value
+
+    def _remove_call(key: CacheKey, call: Any) -> None:
+        with cache.lock:
+            if cache.calls.get(key) is call:
+                del cache.calls[key]
+
+    def _start_task(key: CacheKey, *args: Any, **kwargs: Any) -> "asyncio.Future[Any]":
+        task = cache.calls[key] = asyncio.ensure_future(_async_call(key, *args, **kwargs))
+        task.add_done_callback(partial(_remove_call, key))
+
+        return task
+
+    def _async_revalidate(key: CacheKey, *args: Any, **kwargs: Any) -> None:
+        if key not in cache.calls:
+            task = _start_task(key, *args, **kwargs)
+            # Nobody waits for the result, so exception should be retrieved here
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    @wraps(func)
+    async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = _make_key(args, kwargs)
+
+        with cache.lock:
+            try:
+                entry = _get(key)
+            except KeyError:
+                pass
+            else:
+                if entry.expires <= time():
+                    _async_revalidate(key, *args, **kwargs)
+
+                return entry.result()
+
+            task = cache.calls.get(key)
+
+            if task is not None:
+                cache.stats.hits += 1
+            else:
+                task = _start_task(key, *args, **kwargs)
+
+        # Task is shared by all callers, so it should not be cancelled with one of them
+        return await asyncio.shield(task)
+
+    def _run(call: _Call, key: CacheKey, *args: Any, **kwargs: Any) -> Any:
+        try:
+            value = _call(key, *args, **kwargs)
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(value)
+        finally:
+            _remove_call(key, call)
+
+        return value
+
+    def _run_in_background(call: _Call, key: CacheKey, *args: Any, **kwargs: Any) -> Any:
+        call.owner = threading.get_ident()
+        return _run(call, key, *args, **kwargs)
+
+    def _revalidate(key: CacheKey, *args: Any, **kwargs: Any) -> None:
+        if key not in cache.calls:
+            call = cache.calls[key] = _Call(owner=None)
+            _get_revalidate_executor().submit(
+                copy_context().run, _run_in_background, call, key, *args, **kwargs
+            )
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        _delete_expired_keys()
+        key = _make_key(args, kwargs)
+
+        with cache.lock:
+            try:
+                entry = _get(key)
+            except KeyError:
+                pass
+            else:
+                if entry.expires <= time():
+                    _revalidate(key, *args, **kwargs)
+
+                return entry.result()
+
+            call = cache.calls.get(key)
+            is_new_call = call is None
+
+            if call is None:
+                call = cache.calls[key] = _Call(threading.get_ident())
+
+        if not is_new_call:
+            if call.owner != threading.get_ident():
+                with cache.lock:
+                    cache.stats.hits += 1
+
+                return call.result()
+
+            # Recursive call from the thread that is already calculating value
+            return _call(key, *args, **kwargs)
+
+        return _run(call, key, *args, **kwargs)
 
-        key: CacheKey = (args, tuple(kwargs.items()))
+    def prime(value: Any, *args: Any, **kwargs: Any) -> None:
+        # Value that was received in other way (e.g. as part of bigger response)
+        # is stored only in memory, persistent cache is filled by real calls
+        with cache.lock:
+            cache.set(_make_key(args, kwargs), value, _get_ttl())
 
-        if key not in cache:
-            cache[key] = func(*args, **kwargs)
-            _add_key(key)
+    def is_cached(*args: Any, **kwargs: Any) -> bool:
+        with cache.lock:
+            cache.delete_expired()
+            return _make_key(args, kwargs) in cache
 
-        return cache[key]
+    if asyncio.iscoroutinefunction(func):
+        wrapper = async_wrapper
 
-    wrapper.info: Callable[..., _CacheInfo] = partial(_CacheInfo, cache, keys)  # type: ignore
+    wrapper.is_cached: Callable[..., bool] = is_cached  # type: ignore
+    wrapper.prime: Callable[..., None] = prime  # type: ignore
+    wrapper.info: Callable[..., _CacheInfo] = cache.info  # type: ignore
+    wrapper.clear: Callable[[], None] = cache.clear  # type: ignore
 
     return wrapper
 
 
 __all__ = [
     "CACHED_TIME",
+    "CacheStats",
+    "LATENCY_BUCKETS",
+    "cache_stats",
     "cached",
+    "disable_persistent_cache",
+    "enable_persistent_cache",
     "get_from_cache",
     "write_to_cache",
 ]
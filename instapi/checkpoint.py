@@ -0,0 +1,129 @@
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import time
+from typing import Dict, Optional, Union
+
+from .storage import SQLiteStorage
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """
+    Position of paginated iteration: cursor of next page and rank token
+    that was used to request previous pages
+    """
+
+    cursor: str
+    rank_token: Optional[str] = None
+
+
+class CheckpointStore(ABC):
+    """
+    Storage of pagination checkpoints, it is used by process_many
+    to resume iteration after crash or restart
+    """
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[Checkpoint]:
+        pass
+
+    @abstractmethod
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Checkpoints stored at single json file. File is replaced atomically,
+    so it is never left half-written.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, Dict]:
+        try:
+            with self.path.open() as f:
+                return dict(json.load(f))
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, data: Dict[str, Dict]) -> None:
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+
+        with tmp.open("w") as f:
+            json.dump(data, f)
+
+        os.replace(tmp, self.path)
+
+    def load(self, key: str) -> Optional[Checkpoint]:
+        with self._lock:
+            value = self._read().get(key)
+
+        return Checkpoint(**value) if value is not None else None
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        with self._lock:
+            data = self._read()
+            data[key] = asdict(checkpoint)
+            self._write(data)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            data = self._read()
+
+            if data.pop(key, None) is not None:
+                self._write(data)
+
+
+class SQLiteCheckpointStore(CheckpointStore, SQLiteStorage):
+    """
+    Checkpoints stored at SQLite database, it can be shared between processes
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        super().__init__(path)
+
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints ("
+                "key TEXT PRIMARY KEY, cursor TEXT NOT NULL, rank_token TEXT, updated REAL NOT NULL)"
+            )
+
+    def load(self, key: str) -> Optional[Checkpoint]:
+        row = (
+            self._connection()
+            .execute("SELECT cursor, rank_token FROM checkpoints WHERE key = ?", (key,))
+            .fetchone()
+        )
+
+        return Checkpoint(*row) if row is not None else None
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (key, cursor, rank_token, updated) "
+                "VALUES (?, ?, ?, ?)",
+                (key, checkpoint.cursor, checkpoint.rank_token, time()),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM checkpoints WHERE key = ?", (key,))
+
+
+__all__ = [
+    "Checkpoint",
+    "CheckpointStore",
+    "FileCheckpointStore",
+    "SQLiteCheckpointStore",
+]
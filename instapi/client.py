@@ -6,7 +6,7 @@ from typing import Any, ClassVar, Optional, cast
 from instagram_private_api import ClientError
 
 from . import cache
-from .client_api import Client
+from .client_api import AsyncClient, Client
 from .exceptions import ClientNotInitedException
 
 ssl._create_default_https_context = ssl._create_unverified_context
@@ -35,9 +35,25 @@ class ClientProxy:
 client: Client = cast(Client, ClientProxy())
 
 
+@dataclass
+class AsyncClientProxy:
+    obj: Optional[AsyncClient] = None
+
+    def __getattr__(self, item: str) -> Any:
+        # Until async client is bound blocking methods are used, they are called at executor
+        if self.obj is None:
+            return getattr(client, item)
+
+        return getattr(self.obj, item)
+
+
+async_client: AsyncClient = cast(AsyncClient, AsyncClientProxy())
+
+
 def bind(
     username: Optional[str] = ENV_USERNAME,
     password: Optional[str] = ENV_PASSWORD,
+    use_async: bool = False,
 ) -> None:
     if username is None or password is None:
         raise ValueError("Both username and password should be passed")
@@ -49,8 +65,13 @@ def bind(
 
     cache.write_to_cache((username, password), client.obj.cookie_jar)
 
+    if use_async:
+        cast(AsyncClientProxy, async_client).obj = AsyncClient(client.obj)
+
 
 __all__ = [
+    "async_client",
+    "AsyncClientProxy",
     "bind",
     "client",
     "ClientProxy",
@@ -1,5 +1,7 @@
+from instapi.client_api.async_client import AsyncClient
 from instapi.client_api.client import Client
 
 __all__ = [
+    "AsyncClient",
     "Client",
 ]
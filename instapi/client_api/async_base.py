@@ -0,0 +1,170 @@
+import asyncio
+import json
+from types import SimpleNamespace, TracebackType
+from typing import TYPE_CHECKING, Any, Optional, Type, cast
+
+from instagram_private_api import Client
+from instagram_private_api.errors import (
+    ClientConnectionError,
+    ClientError,
+    ClientLoginRequiredError,
+    ErrorHandler,
+)
+
+from .. import rate_limit
+from ..types import StrDict
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aiohttp import ClientResponse, ClientSession
+
+
+class AsyncBaseClient:
+    """
+    Non-blocking client for Instagram private api.
+    Authentication state (cookies, signature keys, device info)
+    is taken from already logged in blocking client, requests are sent
+    through single aiohttp session with pool of keep-alive connections.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        connections_limit: int = 100,
+        connections_limit_per_host: int = 0,
+    ) -> None:
+        if aiohttp is None:  # pragma: no cover
+            raise RuntimeError("Inst-API is installed without aiohttp\npip install inst-api[async]")
+
+        self.client = client
+        self.connections_limit = connections_limit
+        self.connections_limit_per_host = connections_limit_per_host
+        self._session: Optional["ClientSession"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def default_headers(self) -> StrDict:
+        headers = cast(StrDict, self.client.default_headers)
+        # Blocking client closes connection after each request, but pooled one should keep it
+        headers.pop("Connection", None)
+
+        return headers
+
+    def _get_session(self) -> "ClientSession":
+        loop = asyncio.get_event_loop()
+
+        # Session can't be shared between event loops, e.g. after several asyncio.run calls
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._loop = loop
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.connections_limit,
+                    limit_per_host=self.connections_limit_per_host,
+                ),
+                cookies={c.name: c.value for c in self.client.cookie_jar},
+                timeout=aiohttp.ClientTimeout(total=self.client.timeout),
+            )
+
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._loop = None
+
+    async def __aenter__(self) -> "AsyncBaseClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    def _prepare_data(self, params: Any, unsigned: bool) -> Any:
+        if params == "":
+            return b""
+
+        if unsigned:
+            return params
+
+        json_params = json.dumps(params, separators=(",", ":"))
+
+        return {
+            "ig_sig_key_version": self.client.key_version,
+            "signed_body": f"{self.client._generate_signature(json_params)}.{json_params}",
+        }
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> "ClientResponse":
+        try:
+            response = await self._get_session().request(method, url, **kwargs)
+            await response.read()
+        # Total timeout raises asyncio.TimeoutError, it isn't OSError before python 3.11
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            raise ClientConnectionError(f"{e.__class__.__name__} {e}")
+
+        return response
+
+    @staticmethod
+    async def _raise_for_status(response: "ClientResponse") -> None:
+        if response.status >= 400:
+            http_error = SimpleNamespace(code=response.status, reason=response.reason)
+            ErrorHandler.process(http_error, await response.text())
+
+    async def _call_api(
+        self,
+        endpoint: str,
+        params: Optional[StrDict] = None,
+        query: Optional[StrDict] = None,
+        unsigned: bool = False,
+        version: str = "v1",
+    ) -> StrDict:
+        url = f"{self.client.api_url.format(version=version)}{endpoint}"
+        headers = self.default_headers
+        data = None
+
+        if params or params == "":
+            headers["Content-type"] = "application/x-www-form-urlencoded; charset=UTF-8"
+            data = self._prepare_data(params, unsigned)
+
+        await rate_limit.aacquire(endpoint)
+
+        response = await self._request(
+            "GET" if data is None else "POST",
+            url,
+            params=query,
+            data=data,
+            headers=headers,
+        )
+
+        await self._raise_for_status(response)
+        json_response = cast(StrDict, json.loads(await response.text()))
+
+        if json_response.get("message", "") == "login_required":
+            raise ClientLoginRequiredError(
+                json_response.get("message"),
+                code=response.status,
+                error_response=json.dumps(json_response),
+            )
+
+        # not from oembed or an ok response
+        if not json_response.get("provider_url") and json_response.get("status", "") != "ok":
+            raise ClientError(
+                json_response.get("message", "Unknown error"),
+                code=response.status,
+                error_response=json.dumps(json_response),
+            )
+
+        return json_response
+
+
+__all__ = [
+    "AsyncBaseClient",
+]
@@ -0,0 +1,16 @@
+from .async_direct import AsyncDirectEndpoint
+from .async_media import AsyncMediaEndpoint
+from .async_user import AsyncUserEndpoint
+
+
+class AsyncClient(
+    AsyncDirectEndpoint,
+    AsyncMediaEndpoint,
+    AsyncUserEndpoint,
+):
+    pass
+
+
+__all__ = [
+    "AsyncClient",
+]
@@ -0,0 +1,157 @@
+from typing import Optional, cast
+
+from instagram_private_api.errors import ClientError
+
+from .. import rate_limit
+from ..types import StrDict
+from .async_base import AsyncBaseClient
+from .direct import DirectEndpoint, RecipientUsers
+
+
+class AsyncDirectEndpoint(AsyncBaseClient):
+    async def direct_v2_send_item(
+        self,
+        recipient_users: RecipientUsers,
+        thread_id: Optional[int] = None,
+        *,
+        item_type: str,
+        item_data: StrDict,
+        version: str = "v1",
+    ) -> StrDict:
+        endpoint = f"direct_v2/threads/broadcast/{item_type}/"
+        url = f"{self.client.api_url.format(version=version)}{endpoint}"
+
+        data = {
+            "action": "send_item",
+            "recipient_users": DirectEndpoint._convert_recipient_users(recipient_users),
+            **item_data,
+        }
+
+        if thread_id:
+            data["thread_ids"] = f"[{thread_id}]"
+
+        await rate_limit.aacquire(endpoint)
+
+        response = await self._request(
+            "POST",
+            url,
+            headers=self.default_headers,
+            data={
+                **self.client.authenticated_params,
+                **data,
+            },
+        )
+
+        if response.status >= 400:
+            raise ClientError(response.reason, response.status, await response.text())
+
+        return cast(StrDict, await response.json(content_type=None))
+
+    async def direct_v2_send_text(
+        self,
+        recipient_users: RecipientUsers = (),
+        thread_id: Optional[int] = None,
+        *,
+        text: str,
+    ) -> StrDict:
+        return await self.direct_v2_send_item(
+            recipient_users=recipient_users,
+            thread_id=thread_id,
+            item_type="text",
+            item_data={"text": text},
+        )
+
+    async def direct_v2_send_link(
+        self,
+        recipient_users: RecipientUsers = (),
+        thread_id: Optional[int] = None,
+        *,
+        text: str = "",
+        link: str,
+    ) -> StrDict:
+        return await self.direct_v2_send_item(
+            recipient_users=recipient_users,
+            thread_id=thread_id,
+            item_type="link",
+            item_data={
+                "link_text": text or link,
+                "link_urls": f'["{link}"]',
+            },
+        )
+
+    async def direct_v2_send_media_share(
+        self,
+        recipient_users: RecipientUsers = (),
+        thread_id: Optional[int] = None,
+        *,
+        text: str = "",
+        media_type: str = "photo",
+        media_id: int,
+    ) -> StrDict:
+        return await self.direct_v2_send_item(
+            recipient_users=recipient_users,
+            thread_id=thread_id,
+            item_type="media_share",
+            item_data={
+                "text": text,
+                "media_type": media_type,
+                "media_id": media_id,
+            },
+        )
+
+    async def direct_v2_send_hashtag(
+        self,
+        recipient_users: RecipientUsers = (),
+        thread_id: Optional[int] = None,
+        *,
+        text: str = "",
+        hashtag: str,
+    ) -> StrDict:
+        return await self.direct_v2_send_item(
+            recipient_users=recipient_users,
+            thread_id=thread_id,
+            item_type="hashtag",
+            item_data={
+                "text": text,
+                "hashtag": hashtag,
+            },
+        )
+
+    async def direct_v2_send_profile(
+        self,
+        recipient_users: RecipientUsers = (),
+        thread_id: Optional[int] = None,
+        *,
+        text: str = "",
+        profile_id: int,
+    ) -> StrDict:
+        return await self.direct_v2_send_item(
+            recipient_users=recipient_users,
+            thread_id=thread_id,
+            item_type="profile",
+            item_data={
+                "text": text,
+                "profile_user_id": profile_id,
+            },
+        )
+
+    async def direct_v2_inbox(self, **kwargs: str) -> StrDict:
+        return await self._call_api("direct_v2/inbox", query=kwargs)
+
+    async def direct_v2_get_by_participants(self, recipient_users: RecipientUsers) -> StrDict:
+        return await self._call_api(
+            "direct_v2/threads/get_by_participants",
+            query={
+                "recipient_users": DirectEndpoint._convert_recipient_users(
+                    recipient_users, braces_count=1
+                ),
+            },
+        )
+
+    async def direct_v2_thread(self, thread_id: int, **kwargs: str) -> StrDict:
+        return await self._call_api(f"direct_v2/threads/{thread_id}", query=kwargs)
+
+
+__all__ = [
+    "AsyncDirectEndpoint",
+]
@@ -0,0 +1,54 @@
+from typing import Any, Iterable, Union
+
+from ..types import StrDict
+from ..utils import join
+from .async_base import AsyncBaseClient
+
+
+class AsyncMediaEndpoint(AsyncBaseClient):
+    async def media_info(self, media_id: Union[int, str]) -> StrDict:
+        return await self._call_api(f"media/{media_id}/info/")
+
+    async def medias_info(self, media_ids: Union[str, Iterable[Union[int, str]]]) -> StrDict:
+        if isinstance(media_ids, str):
+            media_ids = [media_ids]
+
+        return await self._call_api(
+            "media/infos/",
+            query={
+                "_uuid": self.client.uuid,
+                "_csrftoken": self.client.csrftoken,
+                "media_ids": join(media_ids),
+                "ranked_content": "true",
+                "include_inactive_reel": "true",
+            },
+        )
+
+    async def media_likers(self, media_id: Union[int, str], **kwargs: Any) -> StrDict:
+        return await self._call_api(f"media/{media_id}/likers/", query=kwargs)
+
+    async def media_comments(self, media_id: Union[int, str], **kwargs: Any) -> StrDict:
+        return await self._call_api(
+            f"media/{media_id}/comments/",
+            query={"can_support_threading": "true", **kwargs},
+        )
+
+    async def feed_timeline(self, **kwargs: Any) -> StrDict:
+        return await self._call_api(
+            "feed/timeline/",
+            params={
+                "_uuid": self.client.uuid,
+                "_csrftoken": self.client.csrftoken,
+                "is_prefetch": "0",
+                "is_pull_to_refresh": "0",
+                "phone_id": self.client.phone_id,
+                "timezone_offset": self.client.timezone_offset,
+                **kwargs,
+            },
+            unsigned=True,
+        )
+
+
+__all__ = [
+    "AsyncMediaEndpoint",
+]
@@ -0,0 +1,56 @@
+from typing import Any
+
+from ..types import StrDict
+from .async_base import AsyncBaseClient
+
+
+class AsyncUserEndpoint(AsyncBaseClient):
+    async def current_user(self) -> StrDict:
+        return await self._call_api(
+            "accounts/current_user/",
+            params=self.client.authenticated_params,
+            query={"edit": "true"},
+        )
+
+    async def user_info(self, user_id: int) -> StrDict:
+        return await self._call_api(f"users/{user_id}/info/")
+
+    async def username_info(self, user_name: str) -> StrDict:
+        return await self._call_api(f"users/{user_name}/usernameinfo/")
+
+    async def user_detail_info(self, user_id: int, **kwargs: Any) -> StrDict:
+        return await self._call_api(f"users/{user_id}/full_detail_info/", query=kwargs)
+
+    async def user_feed(self, user_id: int, **kwargs: Any) -> StrDict:
+        return await self._call_api(f"feed/user/{user_id}/", query=kwargs)
+
+    async def user_story_feed(self, user_id: int) -> StrDict:
+        return await self._call_api(f"feed/user/{user_id}/story/")
+
+    async def user_followers(self, user_id: int, rank_token: str, **kwargs: Any) -> StrDict:
+        return await self._call_api(
+            f"friendships/{user_id}/followers/",
+            query={"rank_token": rank_token, **kwargs},
+        )
+
+    async def user_following(self, user_id: int, rank_token: str, **kwargs: Any) -> StrDict:
+        return await self._call_api(
+            f"friendships/{user_id}/following/",
+            query={"rank_token": rank_token, **kwargs},
+        )
+
+    async def search_users(self, query: str, **kwargs: Any) -> StrDict:
+        return await self._call_api(
+            "users/search/",
+            query={
+                "q": query,
+                "timezone_offset": self.client.timezone_offset,
+                "count": 50,
+                **kwargs,
+            },
+        )
+
+
+__all__ = [
+    "AsyncUserEndpoint",
+]
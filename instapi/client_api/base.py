@@ -1,7 +1,8 @@
-from typing import Optional, cast
+from typing import Any, Optional, cast
 
 from instagram_private_api import Client
 
+from .. import rate_limit, retry
 from ..types import StrDict
 
 
@@ -15,14 +16,23 @@ class BaseClient(Client):
         unsigned: bool = False,
         version: str = "v1",
     ) -> StrDict:
-        value = super()._call_api(
-            endpoint=endpoint,
-            params=params,
-            query=query,
-            return_response=return_response,
-            unsigned=unsigned,
-            version=version,
-        )
+        call_api = super()._call_api
+
+        def _call() -> Any:
+            rate_limit.acquire(endpoint)
+
+            return call_api(
+                endpoint=endpoint,
+                params=params,
+                query=query,
+                return_response=return_response,
+                unsigned=unsigned,
+                version=version,
+            )
+
+        # Only GET requests are retried on server errors, POST can be already processed by server.
+        # Pages are requested with same cursor again, so pagination continues from failed page.
+        value = retry.call_with_retry(_call, idempotent=params is None)
 
         return cast(StrDict, value)
 
@@ -1,8 +1,11 @@
-from typing import Iterable, Optional, Union, cast
+from threading import Lock
+from typing import Any, Iterable, Optional, Union, cast
 
 import requests
 from instagram_private_api.errors import ClientError
+from requests.adapters import HTTPAdapter
 
+from .. import rate_limit, retry
 from ..types import StrDict, SupportsInt_co
 from ..utils import join
 from .base import BaseClient
@@ -11,6 +14,62 @@ RecipientUsers = Union[SupportsInt_co, Iterable[SupportsInt_co]]
 
 
 class DirectEndpoint(BaseClient):
+    def __init__(
+        self,
+        *args: Any,
+        send_pool_connections: int = 1,
+        send_pool_maxsize: int = 10,
+        **kwargs: Any,
+    ) -> None:
+        """
+        :param send_pool_connections: number of hosts to keep connection pools for
+        :param send_pool_maxsize: max number of keep-alive connections to single host
+        """
+        self.send_pool_connections = send_pool_connections
+        self.send_pool_maxsize = send_pool_maxsize
+
+        self._send_session: Optional[requests.Session] = None
+        self._send_session_lock = Lock()
+
+        super().__init__(*args, **kwargs)
+
+    def _create_send_session(self) -> requests.Session:
+        session = requests.Session()
+
+        adapter = HTTPAdapter(
+            pool_connections=self.send_pool_connections,
+            pool_maxsize=self.send_pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        session.headers.update(self.default_headers)
+        # Blocking client closes connection after each request, but pooled one should keep it
+        session.headers.pop("Connection", None)
+
+        # Share same jar, so cookies set by responses are visible for both clients
+        session.cookies = self.cookie_jar
+
+        return session
+
+    @property
+    def send_session(self) -> requests.Session:
+        """
+        Session with pool of keep-alive connections, that is used to send direct messages
+        """
+        if self._send_session is None:
+            with self._send_session_lock:
+                if self._send_session is None:
+                    self._send_session = self._create_send_session()
+
+        return self._send_session
+
+    def close_send_session(self) -> None:
+        with self._send_session_lock:
+            if self._send_session is not None:
+                self._send_session.close()
+                self._send_session = None
+
     @staticmethod
     def _convert_recipient_users(
         recipient_users: RecipientUsers,
@@ -32,7 +91,8 @@ class DirectEndpoint(BaseClient):
         item_data: StrDict,
         version: str = "v1",
     ) -> StrDict:
-        url = f"{self.api_url.format(version=version)}direct_v2/threads/broadcast/{item_type}/"
+        endpoint = f"direct_v2/threads/broadcast/{item_type}/"
+        url = f"{self.api_url.format(version=version)}{endpoint}"
 
         data = {
             "action": "send_item",
@@ -43,10 +103,15 @@ class DirectEndpoint(BaseClient):
         if thread_id:
             data["thread_ids"] = f"[{thread_id}]"
 
-        response = requests.post(
+        # Message can be delivered even if request failed, so only throttled sends are retried
+        return retry.call_with_retry(self._post_item, endpoint, url, data, idempotent=False)
+
+    def _post_item(self, endpoint: str, url: str, data: StrDict) -> StrDict:
+        rate_limit.acquire(endpoint)
+
+        response = self.send_session.post(
             url,
-            headers=self.default_headers,
-            cookies=self.cookie_jar,
+            timeout=self.timeout,
             data={
                 **self.authenticated_params,
                 **data,
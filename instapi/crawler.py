@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from instagram_private_api import ClientError
+
+from .client import client
+from .models import User
+from .storage import SQLiteStorage
+from .utils import page_size_for, parallel_map, process_many
+
+FOLLOWERS = "followers"
+FOLLOWINGS = "followings"
+
+# Listing of private or removed account can't be fetched, such nodes have no edges
+SKIPPED_STATUSES = (400, 403, 404)
+
+# Number of query parameters is limited by sqlite
+SQLITE_MAX_PARAMS = 500
+
+
+@dataclass(frozen=True)
+class Edge:
+    """
+    Follow relation between two users
+    """
+
+    follower: int
+    followee: int
+
+
+class CrawlState(ABC):
+    """
+    Visited users and crawl frontier. Each user is stored once with depth
+    at which it was found first, so it is expanded only once.
+    """
+
+    @abstractmethod
+    def add(self, pks: Iterable[int], depth: int) -> None:
+        pass
+
+    @abstractmethod
+    def pending(self, depth: int) -> List[int]:
+        pass
+
+    @abstractmethod
+    def done(self, pk: int) -> None:
+        pass
+
+    @abstractmethod
+    def select_done(self, pks: Iterable[int]) -> Set[int]:
+        pass
+
+
+class MemoryCrawlState(CrawlState):
+    def __init__(self) -> None:
+        self.depths: Dict[int, int] = {}
+        self.expanded: Set[int] = set()
+
+    def add(self, pks: Iterable[int], depth: int) -> None:
+        for pk in pks:
+            self.depths.setdefault(pk, depth)
+
+    def pending(self, depth: int) -> List[int]:
+        return [pk for pk, d in self.depths.items() if d == depth and pk not in self.expanded]
+
+    def done(self, pk: int) -> None:
+        self.expanded.add(pk)
+
+    def select_done(self, pks: Iterable[int]) -> Set[int]:
+        return self.expanded.intersection(pks)
+
+
+class SQLiteCrawlState(CrawlState, SQLiteStorage):
+    """
+    Crawl state stored at SQLite database, so crawl can be resumed after restart
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        super().__init__(path)
+
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS nodes ("
+                "pk INTEGER PRIMARY KEY, depth INTEGER NOT NULL, done INTEGER NOT NULL DEFAULT 0)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS nodes_frontier ON nodes (depth, done)")
+
+    def add(self, pks: Iterable[int], depth: int) -> None:
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO nodes (pk, depth) VALUES (?, ?)",
+                ((pk, depth) for pk in pks),
+            )
+
+    def pending(self, depth: int) -> List[int]:
+        rows = (
+            self._connection()
+            .execute("SELECT pk FROM nodes WHERE depth = ? AND done = 0 ORDER BY rowid", (depth,))
+            .fetchall()
+        )
+
+        return [pk for pk, in rows]
+
+    def done(self, pk: int) -> None:
+        with self._connection() as conn:
+            conn.execute("UPDATE nodes SET done = 1 WHERE pk = ?", (pk,))
+
+    def select_done(self, pks: Iterable[int]) -> Set[int]:
+        conn = self._connection()
+        pks = [*pks]
+        result: Set[int] = set()
+
+        for i in range(0, len(pks), SQLITE_MAX_PARAMS):
+            chunk = pks[i : i + SQLITE_MAX_PARAMS]
+            rows = conn.execute(
+                f"SELECT pk FROM nodes WHERE done = 1 AND pk IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            result.update(pk for pk, in rows)
+
+        return result
+
+
+class GraphCrawler:
+    """
+    Breadth-first crawler of follow graph. Users of each level are expanded
+    at thread pool, edges are streamed while crawl goes on.
+    User is marked as expanded only after its edges were returned, so after restart
+    with persisted state edges of interrupted users can be returned again.
+    When both directions are crawled, edge to already expanded user is skipped,
+    because it was returned with that user edges. With limit_per_node such edge
+    could be cut from that user listing, so edges are returned as is and
+    same edge can be returned twice.
+    """
+
+    def __init__(
+        self,
+        seeds: Iterable[Union[User, int]],
+        depth: int = 1,
+        directions: Tuple[str, ...] = (FOLLOWERS,),
+        max_workers: int = 4,
+        limit_per_node: Optional[int] = None,
+        state: Optional[CrawlState] = None,
+    ) -> None:
+        """
+        :param seeds: users or pks to start crawl from
+        :param depth: how many levels of users should be expanded, seeds are first level
+        :param directions: which relations should be crawled, FOLLOWERS and/or FOLLOWINGS
+        :param max_workers: number of users which are expanded concurrently
+        :param limit_per_node: max number of followers and followings fetched for single user
+        :param state: store of visited users and frontier, in memory by default
+        """
+        if depth <= 0:
+            raise ValueError("Depth should be positive number")
+
+        unknown = set(directions) - {FOLLOWERS, FOLLOWINGS}
+
+        if unknown or not directions:
+            raise ValueError(f"Invalid directions {directions}")
+
+        self.seeds = [seed.pk if isinstance(seed, User) else seed for seed in seeds]
+        self.depth = depth
+        self.directions = directions
+        self.max_workers = max_workers
+        self.limit_per_node = limit_per_node
+        self.state = state if state is not None else MemoryCrawlState()
+
+    def _neighbours(self, pk: int, direction: str) -> List[int]:
+        fetcher = client.user_followers if direction == FOLLOWERS else client.user_following
+
+        pages = process_many(
+            fetcher,
+            pk,
+            with_rank_token=True,
+            page_size=page_size_for(self.limit_per_node),
+        )
+        pks = (user["pk"] for page in pages for user in page["users"])
+
+        try:
+            return [*islice(pks, self.limit_per_node)]
+        except ClientError as e:
+            if e.code in SKIPPED_STATUSES:
+                return []
+
+            raise
+
+    def _expand(self, pk: int) -> Tuple[int, List[Edge]]:
+        edges: List[Edge] = []
+
+        for direction in self.directions:
+            for other in self._neighbours(pk, direction):
+                edges.append(Edge(other, pk) if direction == FOLLOWERS else Edge(pk, other))
+
+        return pk, edges
+
+    def iter_edges(self) -> Iterator[Edge]:
+        """
+        Crawl graph and generate its edges
+
+        :return: generator with Edge objects
+        """
+        dedup = set(self.directions) == {FOLLOWERS, FOLLOWINGS} and self.limit_per_node is None
+
+        self.state.add(self.seeds, 0)
+
+        for level in range(self.depth):
+            for pk, edges in parallel_map(
+                self._expand, self.state.pending(level), self.max_workers
+            ):
+                neighbours = [_other(edge, pk) for edge in edges]
+
+                if dedup:
+                    expanded = self.state.select_done(neighbours)
+                    yield from (edge for edge in edges if _other(edge, pk) not in expanded)
+                else:
+                    yield from edges
+
+                if level + 1 < self.depth:
+                    self.state.add(neighbours, level + 1)
+
+                self.state.done(pk)
+
+
+def _other(edge: Edge, pk: int) -> int:
+    return edge.follower if edge.followee == pk else edge.followee
+
+
+__all__ = [
+    "CrawlState",
+    "Edge",
+    "FOLLOWERS",
+    "FOLLOWINGS",
+    "GraphCrawler",
+    "MemoryCrawlState",
+    "SQLiteCrawlState",
+]
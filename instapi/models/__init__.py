@@ -1,7 +1,8 @@
 from instapi.models.base import BaseModel, Entity
 from instapi.models.comment import Comment
-from instapi.models.direct import Direct, Message
+from instapi.models.direct import BroadcastResult, Direct, Message
 from instapi.models.feed import Feed
+from instapi.models.liker_index import LikerIndex
 from instapi.models.media import Media
 from instapi.models.resource import (
     Candidate,
@@ -10,14 +11,19 @@ from instapi.models.resource import (
     Resources,
     Video,
 )
+from instapi.models.snapshot import FollowersDiff, FollowersSnapshot
 from instapi.models.story import Story
 from instapi.models.user import User
 
 __all__ = [
     "BaseModel",
+    "BroadcastResult",
     "Direct",
     "Entity",
     "Feed",
+    "FollowersDiff",
+    "FollowersSnapshot",
+    "LikerIndex",
     "Media",
     "Message",
     "Comment",
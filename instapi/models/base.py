@@ -1,7 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass, field, fields
-from typing import AbstractSet, Any, Type, TypeVar, cast
+from typing import (
+    AbstractSet,
+    Any,
+    ClassVar,
+    MutableMapping,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+from weakref import WeakValueDictionary
 
 from ..types import StrDict
 
@@ -45,17 +55,51 @@ class BaseModel(metaclass=BaseModelMeta):
 
 
 class Entity(BaseModel):
+    """
+    Model that has unique identifier, entities with same pk are equal.
+    When use_identity_map is turned on (for Entity or single subclass) create
+    returns already existing instance for same pk if data wasn't changed.
+    """
+
     pk: int = field(repr=False)
 
+    use_identity_map: ClassVar[bool] = False
+    _identity_map: ClassVar[MutableMapping[Tuple[type, int], Entity]] = WeakValueDictionary()
+
+    class Config:
+        # Entity has own __eq__ and __hash__ that are based on pk
+        dataclass_kwargs = {"eq": False}
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if type(self) is not type(other):
+            return NotImplemented
+
+        return self.pk == other.pk
+
     def __hash__(self) -> int:
         return hash(self.pk)
 
     def __int__(self) -> int:
         return self.pk
 
+    def _has_same_data(self, data: StrDict) -> bool:
+        return all(getattr(self, key) == data[key] for key in self.fields() if key in data)
+
     @classmethod
     def create(cls: Type[ModelT_co], data: StrDict) -> ModelT_co:
-        return super().create(data)  # type: ignore
+        if not cast(Type[Entity], cls).use_identity_map or "pk" not in data:
+            return super().create(data)  # type: ignore
+
+        key = (cls, data["pk"])
+        instance = Entity._identity_map.get(key)
+
+        if instance is None or not instance._has_same_data(data):
+            instance = super().create(data)  # type: ignore
+            Entity._identity_map[key] = cast(Entity, instance)
+
+        return cast(ModelT_co, instance)
 
 
 __all__ = [
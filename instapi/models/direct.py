@@ -1,12 +1,26 @@
 from __future__ import annotations
 
-from dataclasses import field
-from typing import Any, Iterable, List, Optional, Tuple, Type
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from ..cache import cached
-from ..client import client
+from ..checkpoint import CheckpointStore
+from ..client import async_client, client
 from ..types import StrDict
-from ..utils import process_many, to_list
+from ..utils import aprocess_many, process_many, to_list
 from .base import BaseModel, ModelT_co
 from .media import Media
 from .user import User
@@ -32,6 +46,22 @@ class Message(BaseModel):
         return data
 
 
+@dataclass(frozen=True)
+class BroadcastResult:
+    """
+    Result of sending message to single recipient of broadcast
+    """
+
+    recipient: Union[User, Direct]
+    direct: Optional[Direct] = None
+    response: Optional[StrDict] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class Direct(BaseModel):
     thread_title: str
     thread_type: str
@@ -55,12 +85,20 @@ class Direct(BaseModel):
         ):
             yield from map(Direct.create, response["inbox"]["threads"])
 
+    @classmethod
+    async def aiter_directs(cls) -> AsyncIterator[Direct]:
+        async for response in aprocess_many(
+            async_client.direct_v2_inbox, key="cursor", key_path="inbox.oldest_cursor"
+        ):
+            for direct in map(Direct.create, response["inbox"]["threads"]):
+                yield direct
+
     @classmethod
     def directs(cls, limit: Optional[int] = None) -> List[Direct]:
         return to_list(cls.iter_directs(), limit)
 
     @classmethod
-    @cached
+    @cached(max_entries=1_024)
     def with_user(cls: Type[ModelT_co], user: User) -> ModelT_co:
         result = client.direct_v2_get_by_participants(user)
 
@@ -69,15 +107,33 @@ class Direct(BaseModel):
         except KeyError:
             return cls(user.username, "private", False, (user,))  # type: ignore
 
-    def iter_message(self) -> Iterable[Message]:
+    def iter_message(self, checkpoint: Optional[CheckpointStore] = None) -> Iterable[Message]:
         for response in process_many(
             client.direct_v2_thread,
             self.thread_id,
             key="cursor",
             key_path="thread.oldest_cursor",
+            checkpoint=checkpoint,
         ):
             yield from map(Message.create, response["thread"]["items"])
 
+    async def aiter_message(self) -> AsyncIterator[Message]:
+        loop = asyncio.get_event_loop()
+
+        async for response in aprocess_many(
+            async_client.direct_v2_thread,
+            self.thread_id,
+            key="cursor",
+            key_path="thread.oldest_cursor",
+        ):
+            # Message.create fetches message authors, so it can't be called at event loop
+            messages = await loop.run_in_executor(
+                None, to_list, map(Message.create, response["thread"]["items"])
+            )
+
+            for message in messages:
+                yield message
+
     def messages(self, limit: Optional[int] = None) -> List[Message]:
         return to_list(self.iter_message(), limit)
 
@@ -88,42 +144,85 @@ class Direct(BaseModel):
             "thread_id": self.thread_id,
         }
 
-    def send_text(self, text: str) -> None:
-        client.direct_v2_send_text(
+    def send_text(self, text: str) -> StrDict:
+        return client.direct_v2_send_text(
             text=text,
             **self._send_args,
         )
 
-    def send_link(self, link: str, text: str = "") -> None:
-        client.direct_v2_send_link(
+    def send_link(self, link: str, text: str = "") -> StrDict:
+        return client.direct_v2_send_link(
             link=link,
             text=text,
             **self._send_args,
         )
 
-    def send_profile(self, user: User, text: str = "") -> None:
-        client.direct_v2_send_profile(
+    def send_profile(self, user: User, text: str = "") -> StrDict:
+        return client.direct_v2_send_profile(
             text=text,
             profile_id=user.pk,
             **self._send_args,
         )
 
-    def send_hashtag(self, hashtag: str, text: str = "") -> None:
-        client.direct_v2_send_hashtag(
+    def send_hashtag(self, hashtag: str, text: str = "") -> StrDict:
+        return client.direct_v2_send_hashtag(
             hashtag=hashtag,
             text=text,
             **self._send_args,
         )
 
-    def send_media(self, media: Media, text: str = "") -> None:
-        client.direct_v2_send_media_share(
+    def send_media(self, media: Media, text: str = "") -> StrDict:
+        return client.direct_v2_send_media_share(
             text=text,
             media_id=media.pk,
             **self._send_args,
         )
 
+    @classmethod
+    def broadcast(
+        cls,
+        recipients: Iterable[Union[User, Direct]],
+        send: Callable[..., Optional[StrDict]],
+        *args: Any,
+        max_workers: int = 10,
+        **kwargs: Any,
+    ) -> List[BroadcastResult]:
+        """
+        Send same message to many recipients concurrently. Users are resolved
+        to threads using Direct.with_user, so repeated lookups are cached.
+        Failed sends doesn't stop broadcast, errors are stored at results.
+
+        >>> Direct.broadcast(users, Direct.send_text, "Hello")
+
+        :param recipients: users or threads to send message
+        :param send: send method of Direct, for instance Direct.send_text
+        :param args: positional arguments of send method
+        :param max_workers: max number of messages that are sent at same time
+        :param kwargs: keyword arguments of send method
+        :return: results in same order as recipients
+        """
+        if max_workers <= 0:
+            raise ValueError("Max workers should be positive number")
+
+        def _send(recipient: Union[User, Direct]) -> BroadcastResult:
+            direct = None
+
+            try:
+                direct = recipient if isinstance(recipient, Direct) else cls.with_user(recipient)
+                response = send(direct, *args, **kwargs)
+            except Exception as e:
+                return BroadcastResult(recipient, direct, error=e)
+
+            return BroadcastResult(recipient, direct, response)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(copy_context().run, _send, r) for r in recipients]
+
+        return [f.result() for f in futures]
+
 
 __all__ = [
+    "BroadcastResult",
     "Direct",
     "Message",
 ]
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Optional, cast
+from typing import AsyncIterator, Iterable, List, Optional, cast
 
 from ..cache import cached
-from ..client import client
+from ..client import async_client, client
 from ..types import StrDict
-from ..utils import process_many, to_list
+from ..utils import aprocess_many, process_many, to_list
 from .comment import Comment
 from .resource import ResourceContainer
 from .user import User
@@ -60,7 +60,7 @@ class Feed(ResourceContainer):
         media_info = self._media_info()
         return media_info.get("carousel_media", [media_info])
 
-    @cached
+    @cached(max_entries=1_024)
     def user_tags(self) -> List[User]:
         """
         Generate list of Users from Feed usertags
@@ -83,6 +83,16 @@ class Feed(ResourceContainer):
         for result in process_many(client.media_likers, self.pk):
             yield from map(User.create, result["users"])
 
+    async def aiter_likes(self) -> AsyncIterator[User]:
+        """
+        Create async generator for iteration over users, which has liked a post
+
+        :return: async generator with users, which has liked a post
+        """
+        async for result in aprocess_many(async_client.media_likers, self.pk):
+            for user in map(User.create, result["users"]):
+                yield user
+
     def likes(self, limit: Optional[int] = None) -> List[User]:
         """
         Generate list of users, which has liked a post
@@ -132,6 +142,16 @@ class Feed(ResourceContainer):
 
             yield from map(Comment.create, result["comments"])
 
+    async def aiter_comments(self) -> AsyncIterator[Comment]:
+        """
+        Create async generator for iteration over comments, which was attached to the post
+
+        :return: async generator with comments
+        """
+        async for result in aprocess_many(async_client.media_comments, self.pk):
+            for c in result["comments"]:
+                yield Comment.create({**c, "user": User.create(c["user"])})
+
     def comments(self, limit: Optional[int] = None) -> List[Comment]:
         """
         Generate list of comments, which was attached to the post
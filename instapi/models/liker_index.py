@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..utils import parallel_map
+from .feed import Feed
+from .user import User
+
+
+class LikerIndex:
+    """
+    In-memory index of users that liked posts. For each liker it keeps
+    bitmap of liked posts (bit i is set when i-th post is liked),
+    so liked_by queries don't send requests.
+    """
+
+    def __init__(self) -> None:
+        self.posts: List[Feed] = []
+        self.users: Dict[int, User] = {}
+        self.bitmaps: Dict[int, int] = {}
+
+    @classmethod
+    def build(cls, posts: Iterable[Feed], max_workers: int = 1) -> LikerIndex:
+        """
+        Create index by fetching likers of posts
+
+        :param posts: posts to index, newest first
+        :param max_workers: number of posts which likers are fetched concurrently
+        :return: liker index
+        """
+        index = cls()
+
+        for post, likers in parallel_map(_with_likes, posts, max_workers):
+            index.add(post, likers)
+
+        return index
+
+    def add(self, post: Feed, likers: Iterable[User]) -> None:
+        """
+        Add post and users that liked it to index
+
+        :param post: post to add
+        :param likers: users that liked the post
+        """
+        bit = 1 << len(self.posts)
+        self.posts.append(post)
+
+        for user in likers:
+            self.users.setdefault(user.pk, user)
+            self.bitmaps[user.pk] = self.bitmaps.get(user.pk, 0) | bit
+
+    def _posts(self, bitmap: int) -> List[Feed]:
+        return [post for i, post in enumerate(self.posts) if bitmap >> i & 1]
+
+    def __len__(self) -> int:
+        return len(self.posts)
+
+    def likers(self) -> List[User]:
+        """
+        Users that liked at least one post
+
+        :return: list of User objects
+        """
+        return [*self.users.values()]
+
+    def post_likers(self, post: Feed) -> List[User]:
+        """
+        Users that liked post
+
+        :param post: indexed post
+        :return: list of User objects
+        """
+        bit = 1 << self.posts.index(post)
+        return [self.users[pk] for pk, bitmap in self.bitmaps.items() if bitmap & bit]
+
+    def liked_by_user(self, user: User) -> List[Feed]:
+        """
+        Posts that were liked by user
+
+        :param user: user to check
+        :return: list of posts
+        """
+        return self._posts(self.bitmaps.get(user.pk, 0))
+
+    def liked_by_users(self, users: Iterable[User]) -> Dict[User, List[Feed]]:
+        """
+        Posts that were liked by each of users
+
+        :param users: users to check
+        :return: mapping of user to list of liked posts
+        """
+        return {user: self.liked_by_user(user) for user in users}
+
+    def liked_by_any(self, users: Iterable[User]) -> List[Feed]:
+        """
+        Posts that were liked by at least one of users
+
+        :param users: users to check
+        :return: list of posts
+        """
+        bitmap = 0
+
+        for user in users:
+            bitmap |= self.bitmaps.get(user.pk, 0)
+
+        return self._posts(bitmap)
+
+    def liked_all(self, last: Optional[int] = None) -> List[User]:
+        """
+        Users that liked all of last posts, posts are expected to be indexed newest first
+
+        :param last: number of last posts to check, all posts by default
+        :return: list of User objects
+        """
+        if last is not None and last < 0:
+            raise ValueError("Last can't be negative number")
+
+        mask = (1 << min(len(self.posts), len(self.posts) if last is None else last)) - 1
+
+        return [self.users[pk] for pk, bitmap in self.bitmaps.items() if bitmap & mask == mask]
+
+
+def _with_likes(post: Feed) -> Tuple[Feed, List[User]]:
+    return post, post.likes()
+
+
+__all__ = [
+    "LikerIndex",
+]
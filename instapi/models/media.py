@@ -1,17 +1,64 @@
-from typing import cast
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Type, cast
 
 from ..cache import cached
 from ..client import client
 from ..types import StrDict
-from .base import Entity
+from .base import Entity, ModelT_co
+
+# Listing endpoints (user feed, timeline) return full media objects, same as media_info
+_MEDIA_INFO_KEYS = ("image_versions2", "video_versions", "carousel_media")
+
+# Max number of medias that are requested at single medias_info call
+MEDIAS_INFO_BATCH_SIZE = 50
 
 
 class Media(Entity):
-    @cached
+    @classmethod
+    def create(cls: Type[ModelT_co], data: StrDict) -> ModelT_co:
+        media = super().create(data)
+
+        if any(key in data for key in _MEDIA_INFO_KEYS):
+            # Resources are taken from data in hand instead of separate media_info call
+            Media._media_info.prime(data, media)  # type: ignore
+
+        return media
+
+    @cached(max_entries=1_024, persistent=True)
     def _media_info(self) -> StrDict:
         items, *_ = client.media_info(self.pk)["items"]
         return cast(StrDict, items)
 
+    @staticmethod
+    def prefetch(medias: Iterable[Media], batch_size: int = MEDIAS_INFO_BATCH_SIZE) -> None:
+        """
+        Fetch info of many medias using batched requests, so following
+        calls that need media info (resources, caption, etc.) don't send requests.
+        Medias from listings (timeline, user feed) already have info from payload,
+        it is needed for medias created only from pk.
+
+        :param medias: medias to fetch info
+        :param batch_size: max number of medias at single request
+        """
+        if batch_size <= 0:
+            raise ValueError("Batch size should be positive number")
+
+        missing: Dict[int, List[Media]] = {}
+
+        for media in medias:
+            if not Media._media_info.is_cached(media):  # type: ignore
+                missing.setdefault(media.pk, []).append(media)
+
+        pks = [*missing]
+
+        for start in range(0, len(pks), batch_size):
+            response = client.medias_info([str(pk) for pk in pks[start : start + batch_size]])
+
+            for item in response["items"]:
+                for media in missing.get(item["pk"], ()):
+                    Media._media_info.prime(item, media)  # type: ignore
+
     def comment(self, text: str) -> None:
         client.post_comment(self.pk, text)
 
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import time
+from typing import FrozenSet, Iterable, List, Optional, Tuple, Union
+
+
+@dataclass(frozen=True)
+class FollowersDiff:
+    """
+    Changes of followers list between two snapshots
+    """
+
+    added: FrozenSet[int]
+    removed: FrozenSet[int]
+    verified: bool = False
+
+
+@dataclass(frozen=True)
+class FollowersSnapshot:
+    """
+    Followers pks in same order as api returns them (newest first)
+    """
+
+    pks: Tuple[int, ...]
+    created: float
+    verified: float
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Optional[FollowersSnapshot]:
+        try:
+            with Path(path).open() as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+
+        return cls(tuple(data["pks"]), data["created"], data["verified"])
+
+    def save(self, path: Union[str, Path]) -> None:
+        path = Path(path)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+        with tmp.open("w") as f:
+            json.dump(asdict(self), f)
+
+        os.replace(tmp, path)
+
+
+def _full_diff(
+    snapshot: Optional[FollowersSnapshot],
+    pks: List[int],
+    now: float,
+) -> Tuple[FollowersSnapshot, FollowersDiff]:
+    old = frozenset(snapshot.pks if snapshot is not None else ())
+    new = frozenset(pks)
+
+    return FollowersSnapshot(tuple(pks), now, now), FollowersDiff(new - old, old - new, True)
+
+
+def update_snapshot(
+    snapshot: Optional[FollowersSnapshot],
+    pks: Iterable[int],
+    overlap: int = 50,
+    verify_interval: float = 24 * 60 * 60,
+) -> Tuple[FollowersSnapshot, FollowersDiff]:
+    """
+    Compare followers with previous snapshot. New followers are returned first,
+    so pks are consumed only until overlap pks that go in a row at snapshot too are met.
+    Removed followers are found only before that point, full pass is done
+    when there is no snapshot or it wasn't verified during verify_interval.
+
+    :param snapshot: previous snapshot or None
+    :param pks: lazy iterable with followers pks, newest first
+    :param overlap: number of known pks in a row to stop at
+    :param verify_interval: seconds between full passes
+    :return: new snapshot and diff
+    """
+    if overlap <= 0:
+        raise ValueError("Overlap should be positive number")
+
+    now = time()
+
+    if snapshot is None or now - snapshot.verified >= verify_interval:
+        return _full_diff(snapshot, [*pks], now)
+
+    positions = {pk: i for i, pk in enumerate(snapshot.pks)}
+    scanned: List[int] = []
+    known_in_row = 0
+    prev_position = -1
+
+    for pk in pks:
+        scanned.append(pk)
+        position = positions.get(pk)
+
+        # Run counts only pks that follow each other at previous snapshot too
+        if position is None:
+            known_in_row = 0
+        elif known_in_row and position == prev_position + 1:
+            known_in_row += 1
+        else:
+            known_in_row = 1
+
+        prev_position = -1 if position is None else position
+
+        if known_in_row >= overlap:
+            break
+    else:
+        # All followers were fetched, so it is same as full pass
+        return _full_diff(snapshot, scanned, now)
+
+    old = frozenset(snapshot.pks)
+    anchor = positions[scanned[-overlap]]
+    seen = frozenset(scanned)
+
+    added = seen - old
+    removed = frozenset(snapshot.pks[:anchor]) - seen
+    rest = tuple(pk for pk in snapshot.pks[anchor:] if pk not in seen)
+
+    return (
+        FollowersSnapshot((*scanned, *rest), now, snapshot.verified),
+        FollowersDiff(added, removed),
+    )
+
+
+__all__ = [
+    "FollowersDiff",
+    "FollowersSnapshot",
+    "update_snapshot",
+]
@@ -2,20 +2,52 @@ from __future__ import annotations
 
 from collections import Counter as RealCounter
 from itertools import chain
-from typing import TYPE_CHECKING, Counter, Iterable, List, Optional, cast
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Counter,
+    Iterable,
+    List,
+    Optional,
+    Union,
+    cast,
+)
+
+from instagram_private_api import ClientError
 
 from ..cache import cached
-from ..client import client
+from ..checkpoint import CheckpointStore
+from ..client import async_client, client
+from ..pkset import PkSet
 from ..types import StrDict
-from ..utils import process_many, to_list
+from ..utils import (
+    MAX_PAGE_SIZE,
+    aprocess_many,
+    page_size_for,
+    parallel_map,
+    process_many,
+    to_list,
+)
 from .base import Entity
 from .resource import Resource
 
 if TYPE_CHECKING:  # pragma: no cover
     from .feed import Feed
+    from .liker_index import LikerIndex
+    from .snapshot import FollowersDiff
     from .story import Story
 
 
+def _is_not_found(error: BaseException) -> bool:
+    return isinstance(error, ClientError) and error.code == 404
+
+
+def _feed_likes(feed: Feed) -> List[User]:
+    return feed.likes()
+
+
 class User(Entity):
     username: str
     full_name: str
@@ -23,7 +55,7 @@ class User(Entity):
     is_verified: bool
 
     @classmethod
-    @cached
+    @cached(max_entries=10_000, persistent=True, cache_errors=_is_not_found, errors_ttl=5 * 60)
     def get(cls, pk: int) -> User:
         """
         Create User object from unique user's identifier
@@ -34,7 +66,13 @@ class User(Entity):
         return cls.create(client.user_info(pk)["user"])
 
     @classmethod
-    @cached
+    @cached(
+        max_entries=10_000,
+        persistent=True,
+        ttl=60 * 60,
+        cache_errors=_is_not_found,
+        errors_ttl=10 * 60,
+    )
     def from_username(cls, username: str) -> User:
         """
         Create User object from username
@@ -109,7 +147,7 @@ class User(Entity):
     def user_detail(self) -> StrDict:
         return cast(StrDict, self.full_info()["user_detail"]["user"])
 
-    @cached
+    @cached(max_entries=1_024, ttl=30, stale_ttl=60)
     def full_info(self) -> StrDict:
         return cast(StrDict, client.user_detail_info(self.pk))
 
@@ -139,14 +177,14 @@ class User(Entity):
 
     def iter_images(self) -> Iterable[Resource]:
         for feed in self.iter_feeds():
-            yield from feed.images()
+            yield from feed.iter_images()
 
     def images(self, limit: Optional[int] = None) -> List[Resource]:
         return to_list(self.iter_images(), limit=limit)
 
     def iter_videos(self) -> Iterable[Resource]:
-        for feed in self.feeds():
-            yield from feed.videos()
+        for feed in self.iter_feeds():
+            yield from feed.iter_videos()
 
     def videos(self, limit: Optional[int] = None) -> List[Resource]:
         return to_list(self.iter_videos(), limit=limit)
@@ -158,20 +196,95 @@ class User(Entity):
     def resources(self, limit: Optional[int] = None) -> List[Resource]:
         return to_list(self.iter_resources(), limit=limit)
 
-    def iter_followers(self) -> Iterable[User]:
-        for result in process_many(client.user_followers, self.pk, with_rank_token=True):
+    def iter_followers(
+        self,
+        prefetch_depth: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterable[User]:
+        """
+        Create generator for followers
+
+        :param prefetch_depth: how many next pages should be fetched at background
+        :param checkpoint: store to save position of iteration, so it can be resumed after restart
+        :param page_size: how many users should be requested at single page
+        :return: generator with User objects
+        """
+        for result in process_many(
+            client.user_followers,
+            self.pk,
+            with_rank_token=True,
+            prefetch_depth=prefetch_depth,
+            checkpoint=checkpoint,
+            page_size=page_size,
+        ):
             yield from map(User.create, result["users"])
 
+    async def aiter_followers(self) -> AsyncIterator[User]:
+        """
+        Create async generator for followers
+
+        :return: async generator with User objects
+        """
+        async for result in aprocess_many(
+            async_client.user_followers, self.pk, with_rank_token=True
+        ):
+            for user in map(User.create, result["users"]):
+                yield user
+
     def followers(self, limit: Optional[int] = None) -> List[User]:
-        return to_list(self.iter_followers(), limit=limit)
+        return to_list(self.iter_followers(page_size=page_size_for(limit)), limit=limit)
+
+    def followers_diff(
+        self,
+        path: Union[str, Path],
+        overlap: int = 50,
+        verify_interval: float = 24 * 60 * 60,
+    ) -> FollowersDiff:
+        """
+        Find new and lost followers since previous call. Followers snapshot is stored at path,
+        followers are fetched only until overlap of known followers is reached and
+        full list is fetched only once per verify_interval.
+
+        :param path: path to file with followers snapshot
+        :param overlap: number of known followers in a row to stop fetching at
+        :param verify_interval: seconds between fetching full followers list
+        :return: FollowersDiff object with added and removed pks
+        """
+        from instapi.models.snapshot import FollowersSnapshot, update_snapshot
+
+        snapshot, diff = update_snapshot(
+            FollowersSnapshot.load(path),
+            (user.pk for user in self.iter_followers()),
+            overlap=overlap,
+            verify_interval=verify_interval,
+        )
+        snapshot.save(path)
 
-    def iter_followings(self) -> Iterable[User]:
+        return diff
+
+    def iter_followings(
+        self,
+        prefetch_depth: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterable[User]:
         """
         Create generator for followers
 
+        :param prefetch_depth: how many next pages should be fetched at background
+        :param checkpoint: store to save position of iteration, so it can be resumed after restart
+        :param page_size: how many users should be requested at single page
         :return: generator with User objects
         """
-        for result in process_many(client.user_following, self.pk, with_rank_token=True):
+        for result in process_many(
+            client.user_following,
+            self.pk,
+            with_rank_token=True,
+            prefetch_depth=prefetch_depth,
+            checkpoint=checkpoint,
+            page_size=page_size,
+        ):
             yield from map(User.create, result["users"])
 
     def followings(self, limit: Optional[int] = None) -> List[User]:
@@ -181,16 +294,67 @@ class User(Entity):
         :param limit: number of images, which will be added to the list
         :return: list with User objects
         """
-        return to_list(self.iter_followings(), limit=limit)
+        return to_list(self.iter_followings(page_size=page_size_for(limit)), limit=limit)
+
+    def follower_pks(self) -> PkSet:
+        """
+        Fetch pks of all followers to compact set, User objects aren't created
 
-    def iter_feeds(self) -> Iterable[Feed]:
+        :return: PkSet object
+        """
+        return PkSet.from_pages(
+            process_many(
+                client.user_followers,
+                self.pk,
+                with_rank_token=True,
+                page_size=MAX_PAGE_SIZE,
+            )
+        )
+
+    def following_pks(self) -> PkSet:
+        """
+        Fetch pks of all followings to compact set, User objects aren't created
+
+        :return: PkSet object
+        """
+        return PkSet.from_pages(
+            process_many(
+                client.user_following,
+                self.pk,
+                with_rank_token=True,
+                page_size=MAX_PAGE_SIZE,
+            )
+        )
+
+    def iter_feeds(
+        self,
+        checkpoint: Optional[CheckpointStore] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterable[Feed]:
         from instapi.models.feed import Feed
 
-        for result in process_many(client.user_feed, self.pk):
+        for result in process_many(
+            client.user_feed,
+            self.pk,
+            checkpoint=checkpoint,
+            page_size=page_size,
+        ):
             yield from map(Feed.create, result["items"])
 
+    async def aiter_feeds(self) -> AsyncIterator[Feed]:
+        """
+        Create async generator for user's posts
+
+        :return: async generator with Feed objects
+        """
+        from instapi.models.feed import Feed
+
+        async for result in aprocess_many(async_client.user_feed, self.pk):
+            for feed in map(Feed.create, result["items"]):
+                yield feed
+
     def feeds(self, limit: Optional[int] = None) -> List[Feed]:
-        return to_list(self.iter_feeds(), limit=limit)
+        return to_list(self.iter_feeds(page_size=page_size_for(limit)), limit=limit)
 
     def total_comments(self) -> int:
         return sum(feed.comment_count for feed in self.iter_feeds())
@@ -198,11 +362,57 @@ class User(Entity):
     def total_likes(self) -> int:
         return sum(feed.like_count for feed in self.iter_feeds())
 
-    def likes_chain(self) -> Iterable[User]:
-        return chain.from_iterable(feed.iter_likes() for feed in self.iter_feeds())
+    def likes_chain(self, max_workers: int = 1) -> Iterable[User]:
+        """
+        Create generator with users that liked user's posts
+
+        :param max_workers: number of posts which likers are fetched concurrently
+        :return: generator with User objects
+        """
+        if max_workers == 1:
+            return chain.from_iterable(feed.iter_likes() for feed in self.iter_feeds())
+
+        return chain.from_iterable(parallel_map(_feed_likes, self.iter_feeds(), max_workers))
+
+    def likes_statistic(
+        self,
+        max_workers: int = 1,
+        on_progress: Optional[Callable[[int, Counter[User]], None]] = None,
+    ) -> Counter[User]:
+        """
+        Count how many times each user liked user's posts
+
+        :param max_workers: number of posts which likers are fetched concurrently
+        :param on_progress: callback that is called with number of processed posts
+            and partial statistic after each post
+        :return: Counter of User objects
+        """
+        if max_workers == 1 and on_progress is None:
+            return RealCounter(self.likes_chain())
+
+        statistic: Counter[User] = RealCounter()
+        likes = parallel_map(_feed_likes, self.iter_feeds(), max_workers)
+
+        for processed, users in enumerate(likes, 1):
+            statistic.update(users)
+
+            if on_progress is not None:
+                on_progress(processed, statistic)
+
+        return statistic
+
+    def liker_index(self, limit: Optional[int] = None, max_workers: int = 1) -> LikerIndex:
+        """
+        Build index of users that liked user's posts, it answers
+        liked_by queries for many users without new requests
+
+        :param limit: number of last posts to index
+        :param max_workers: number of posts which likers are fetched concurrently
+        :return: LikerIndex object
+        """
+        from instapi.models.liker_index import LikerIndex
 
-    def likes_statistic(self) -> Counter[User]:
-        return RealCounter(self.likes_chain())
+        return LikerIndex.build(self.feeds(limit), max_workers=max_workers)
 
     def iter_liked_by_user(self, user: User) -> Iterable[Feed]:
         return (f for f in self.iter_feeds() if f.liked_by(user))
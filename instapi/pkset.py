@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import mmap
+from array import array
+from bisect import bisect_left
+from importlib import import_module
+from itertools import filterfalse
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Union
+
+from .types import StrDict
+
+try:
+    np: Any = import_module("numpy")
+except ImportError:  # pragma: no cover
+    np = None
+
+# Sorted unique pks, array or memoryview of mapped file
+PkBuffer = Union["array[int]", memoryview]
+
+
+def _is_sorted(data: PkBuffer) -> bool:
+    return all(data[i] < data[i + 1] for i in range(len(data) - 1))
+
+
+class PkSet:
+    """
+    Compact set of pks. Pks are stored as sorted int64 array (8 bytes per pk),
+    membership is binary search. Set operations are vectorised with NumPy
+    when it is installed (pip install inst-api[numpy]), otherwise
+    temporary hash set of one operand is used to filter the other.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, pks: Iterable[int] = ()) -> None:
+        data = array("q", pks)
+
+        if not _is_sorted(data):
+            data = array("q", sorted(set(data)))
+
+        self._data: PkBuffer = data
+
+    @classmethod
+    def _from_sorted(cls, data: PkBuffer) -> PkSet:
+        pkset = cls.__new__(cls)
+        pkset._data = data
+
+        return pkset
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[StrDict], key: str = "users") -> PkSet:
+        """
+        Create set from api pages without creating model objects
+
+        :param pages: pages returned by api, for example user_followers results
+        :param key: key of page items
+        :return: PkSet object
+        """
+        return cls(item["pk"] for page in pages for item in page[key])
+
+    @classmethod
+    def load(cls, path: Union[str, Path], use_mmap: bool = False) -> PkSet:
+        """
+        Load set saved by save method
+
+        :param path: path to file
+        :param use_mmap: map file to memory instead of reading it, set will be read-only
+        :return: PkSet object
+        """
+        with Path(path).open("rb") as f:
+            if not use_mmap:
+                data = array("q")
+                data.frombytes(f.read())
+
+                return cls._from_sorted(data)
+
+            # Empty file can't be mapped
+            if not Path(path).stat().st_size:
+                return cls()
+
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return cls._from_sorted(memoryview(mapped).cast("q"))
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Save set to file as raw int64 array
+
+        :param path: path to file
+        """
+        with Path(path).open("wb") as f:
+            f.write(self._data.tobytes())
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data) * 8
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._data)
+
+    def __contains__(self, pk: object) -> bool:
+        if not isinstance(pk, int):
+            return False
+
+        i = bisect_left(self._data, pk)
+
+        return i < len(self._data) and self._data[i] == pk
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, PkSet):
+            return NotImplemented
+
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{len(self)} pks>)"
+
+    def intersection(self, *others: PkSet) -> PkSet:
+        """
+        Pks that are present at all sets
+
+        :param others: sets to intersect with
+        :return: PkSet object
+        """
+        result = self
+
+        for other in others:
+            result = PkSet._from_sorted(_intersect(result._data, other._data))
+
+        return result
+
+    def union(self, *others: PkSet) -> PkSet:
+        """
+        Pks that are present at any of sets
+
+        :param others: sets to unite with
+        :return: PkSet object
+        """
+        result = self
+
+        for other in others:
+            result = PkSet._from_sorted(_unite(result._data, other._data))
+
+        return result
+
+    def difference(self, *others: PkSet) -> PkSet:
+        """
+        Pks that are not present at any of other sets
+
+        :param others: sets to subtract
+        :return: PkSet object
+        """
+        result = self
+
+        for other in others:
+            result = PkSet._from_sorted(_subtract(result._data, other._data))
+
+        return result
+
+    __and__ = intersection
+    __or__ = union
+    __sub__ = difference
+
+
+def _from_numpy(data: Any) -> "array[int]":
+    result = array("q")
+    result.frombytes(data.astype(np.int64).tobytes())
+
+    return result
+
+
+def _to_numpy(data: PkBuffer) -> Any:
+    return np.frombuffer(data, dtype=np.int64) if len(data) else np.empty(0, dtype=np.int64)
+
+
+def _intersect(a: PkBuffer, b: PkBuffer) -> "array[int]":
+    if np is not None:
+        return _from_numpy(np.intersect1d(_to_numpy(a), _to_numpy(b), assume_unique=True))
+
+    if len(a) > len(b):
+        a, b = b, a
+
+    # Filtered array is sorted, so result is sorted too
+    return array("q", filter(set(a).__contains__, b))
+
+
+def _subtract(a: PkBuffer, b: PkBuffer) -> "array[int]":
+    if np is not None:
+        return _from_numpy(np.setdiff1d(_to_numpy(a), _to_numpy(b), assume_unique=True))
+
+    return array("q", filterfalse(set(b).__contains__, a))
+
+
+def _unite(a: PkBuffer, b: PkBuffer) -> "array[int]":
+    if np is not None:
+        # Stable sort merges two sorted runs, then duplicates are next to each other
+        data = np.concatenate((_to_numpy(a), _to_numpy(b)))
+        data.sort(kind="stable")
+
+        return _from_numpy(data[np.concatenate(([True], data[1:] != data[:-1]))])
+
+    return array("q", sorted({*a, *b}))
+
+
+__all__ = [
+    "PkSet",
+]
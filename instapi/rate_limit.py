@@ -0,0 +1,286 @@
+import asyncio
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import sleep, time
+from typing import Dict, Iterator, Mapping, Optional, Pattern, Tuple, Union
+
+READS = "reads"
+LIKES = "likes"
+FOLLOWS = "follows"
+DIRECT = "direct"
+
+# Endpoint families are checked in order, endpoints that don't match any of them are reads
+ENDPOINT_FAMILIES: Tuple[Tuple[str, Pattern], ...] = (
+    (DIRECT, re.compile(r"^direct_v2/threads/broadcast/")),
+    (FOLLOWS, re.compile(r"^friendships/(create|destroy)/")),
+    (LIKES, re.compile(r"/(like|unlike|comment_like|comment_unlike)/?$")),
+)
+
+RateLimit = Tuple[float, float]
+
+
+def per_hour(requests: float, burst: float = 1) -> RateLimit:
+    """
+    Create rate limit from number of requests per hour
+
+    :param requests: how many requests can be sent during hour
+    :param burst: how many requests can be sent at once
+    :return: rate limit as tuple of requests per second and burst
+    """
+    return requests / 3600, burst
+
+
+DEFAULT_RATE_LIMITS: Mapping[str, RateLimit] = {
+    READS: per_hour(3_600, burst=20),
+    LIKES: per_hour(300, burst=5),
+    FOLLOWS: per_hour(150, burst=5),
+    DIRECT: per_hour(1_200, burst=10),
+}
+
+
+def endpoint_family(endpoint: str) -> str:
+    """
+    Get family of api endpoint that is used to find rate limit
+
+    :param endpoint: endpoint path, for instance "media/1/like/"
+    :return: endpoint family
+    """
+    for family, pattern in ENDPOINT_FAMILIES:
+        if pattern.search(endpoint):
+            return family
+
+    return READS
+
+
+def _reserve(
+    tokens: float,
+    updated: float,
+    now: float,
+    rate: float,
+    capacity: float,
+    count: float,
+) -> Tuple[float, float]:
+    # Tokens can go below zero, it means that requests are already scheduled for future
+    tokens = min(capacity, tokens + max(now - updated, 0) * rate) - count
+    delay = -tokens / rate if tokens < 0 else 0.0
+
+    return tokens, delay
+
+
+@dataclass
+class TokenBucket:
+    """
+    Thread-safe token bucket. Each request reserves tokens and waits
+    until they are refilled, so callers are served in order of arrival.
+    """
+
+    rate: float
+    capacity: float
+
+    tokens: float = field(init=False)
+    updated: float = field(init=False)
+    lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0 or self.capacity <= 0:
+            raise ValueError("Rate and capacity should be positive numbers")
+
+        self.tokens = self.capacity
+        self.updated = time()
+
+    def reserve(self, count: float = 1) -> float:
+        """
+        Take tokens from bucket
+
+        :param count: number of tokens to take
+        :return: how many seconds caller should wait before sending request
+        """
+        with self.lock:
+            now = time()
+            self.tokens, delay = _reserve(
+                self.tokens, self.updated, now, self.rate, self.capacity, count
+            )
+            self.updated = now
+
+        return delay
+
+
+class SQLiteTokenBucket(TokenBucket):
+    """
+    Token bucket which state is stored at SQLite database,
+    so it can be shared between processes on same host.
+    """
+
+    def __init__(self, rate: float, capacity: float, path: Union[str, Path], name: str) -> None:
+        self.path = str(path)
+        self.name = name
+        self._local = threading.local()
+
+        super().__init__(rate, capacity)
+
+        with self._transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets "
+                "(name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                (self.name, self.tokens, self.updated),
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = getattr(self._local, "conn", None)
+
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+
+        # Write lock is taken at start of transaction, so concurrent reservations are serialized
+        conn.execute("BEGIN IMMEDIATE")
+
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+
+    def reserve(self, count: float = 1) -> float:
+        with self._transaction() as conn:
+            now = time()
+            tokens, updated = conn.execute(
+                "SELECT tokens, updated FROM buckets WHERE name = ?", (self.name,)
+            ).fetchone()
+
+            tokens, delay = _reserve(tokens, updated, now, self.rate, self.capacity, count)
+
+            conn.execute(
+                "UPDATE buckets SET tokens = ?, updated = ? WHERE name = ?",
+                (tokens, now, self.name),
+            )
+
+        return delay
+
+
+class RateLimiter:
+    """
+    Client-wide scheduler with token bucket per endpoint family
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, RateLimit]] = None,
+        path: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """
+        :param limits: mapping of endpoint family to rate limit, families without limit aren't throttled
+        :param path: path to SQLite database to share limits between processes
+        """
+        self.limits = {**DEFAULT_RATE_LIMITS, **(limits or {})}
+        self.path = path
+        self.buckets: Dict[str, TokenBucket] = {
+            family: self._create_bucket(family, rate, burst)
+            for family, (rate, burst) in self.limits.items()
+        }
+
+    def _create_bucket(self, family: str, rate: float, burst: float) -> TokenBucket:
+        if self.path is None:
+            return TokenBucket(rate, burst)
+
+        return SQLiteTokenBucket(rate, burst, self.path, family)
+
+    def reserve(self, endpoint: str) -> float:
+        """
+        Reserve request to endpoint
+
+        :param endpoint: endpoint path
+        :return: how many seconds caller should wait before sending request
+        """
+        bucket = self.buckets.get(endpoint_family(endpoint))
+
+        if bucket is None:
+            return 0.0
+
+        return bucket.reserve()
+
+    def acquire(self, endpoint: str) -> None:
+        """
+        Block current thread until request to endpoint can be sent
+
+        :param endpoint: endpoint path
+        """
+        delay = self.reserve(endpoint)
+
+        if delay:
+            sleep(delay)
+
+    async def aacquire(self, endpoint: str) -> None:
+        """
+        Suspend current task until request to endpoint can be sent
+
+        :param endpoint: endpoint path
+        """
+        delay = self.reserve(endpoint)
+
+        if delay:
+            await asyncio.sleep(delay)
+
+
+_RATE_LIMITER: Optional[RateLimiter] = None
+
+
+def enable_rate_limiter(
+    limits: Optional[Mapping[str, RateLimit]] = None,
+    path: Optional[Union[str, Path]] = None,
+) -> RateLimiter:
+    """
+    Throttle all requests of client
+
+    :param limits: rate limits that override DEFAULT_RATE_LIMITS
+    :param path: path to SQLite database to share limits between processes
+    :return: enabled rate limiter
+    """
+    global _RATE_LIMITER
+    _RATE_LIMITER = RateLimiter(limits, path)
+
+    return _RATE_LIMITER
+
+
+def disable_rate_limiter() -> None:
+    global _RATE_LIMITER
+    _RATE_LIMITER = None
+
+
+def acquire(endpoint: str) -> None:
+    if _RATE_LIMITER is not None:
+        _RATE_LIMITER.acquire(endpoint)
+
+
+async def aacquire(endpoint: str) -> None:
+    if _RATE_LIMITER is not None:
+        await _RATE_LIMITER.aacquire(endpoint)
+
+
+__all__ = [
+    "DEFAULT_RATE_LIMITS",
+    "DIRECT",
+    "ENDPOINT_FAMILIES",
+    "FOLLOWS",
+    "LIKES",
+    "READS",
+    "RateLimiter",
+    "SQLiteTokenBucket",
+    "TokenBucket",
+    "aacquire",
+    "acquire",
+    "disable_rate_limiter",
+    "enable_rate_limiter",
+    "endpoint_family",
+    "per_hour",
+]
@@ -0,0 +1,176 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from random import uniform
+from time import sleep
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+from instagram_private_api.errors import (
+    ClientConnectionError,
+    ClientError,
+    ClientThrottledError,
+)
+
+T = TypeVar("T")
+
+RETRYABLE_STATUSES: Tuple[int, ...] = (429, 500, 502, 503, 504)
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """
+    Get delay from Retry-After header of response that caused error
+
+    :param error: error raised by client
+    :return: delay in seconds or None if header is missing
+    """
+    source: Optional[BaseException] = error
+
+    # Client errors are raised while handling http errors, so response is available at context
+    while source is not None:
+        headers = getattr(source, "headers", None)
+
+        if headers is None:
+            headers = getattr(getattr(source, "response", None), "headers", None)
+
+        value = headers.get("Retry-After") if headers is not None else None
+
+        if value is not None:
+            return _parse_retry_after(value)
+
+        source = source.__cause__ or source.__context__
+
+    return None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry policy with exponential backoff and full jitter
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    jitter: bool = True
+    retry_statuses: Tuple[int, ...] = RETRYABLE_STATUSES
+
+    def __post_init__(self) -> None:
+        if self.max_attempts <= 0:
+            raise ValueError("Max attempts should be positive number")
+
+    def is_retryable(self, error: BaseException, idempotent: bool = True) -> bool:
+        """
+        Check if request that raised error can be sent again
+
+        :param error: error raised by client
+        :param idempotent: is it safe to send request twice
+        :return: True if request can be retried
+        """
+        if isinstance(error, ClientThrottledError):
+            return True
+
+        # Server could process request before failure, so only throttled requests are safe
+        if not idempotent:
+            return isinstance(error, ClientError) and error.code == 429
+
+        if isinstance(error, ClientConnectionError):
+            return True
+
+        return isinstance(error, ClientError) and error.code in self.retry_statuses
+
+    def delay(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """
+        Get delay before next attempt
+
+        :param attempt: number of failed attempts
+        :param error: error of last attempt
+        :return: delay in seconds
+        """
+        if error is not None:
+            after = retry_after(error)
+
+            if after is not None:
+                return after
+
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+
+        return uniform(0, delay) if self.jitter else delay
+
+    def call(self, func: Callable[..., T], *args: Any, idempotent: bool = True, **kwargs: Any) -> T:
+        """
+        Call function and retry it on retryable errors
+
+        :param func: function to call
+        :param args: positional arguments of function
+        :param idempotent: is it safe to call function twice
+        :param kwargs: keyword arguments of function
+        :return: result of function
+        """
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self.max_attempts or not self.is_retryable(e, idempotent):
+                    raise
+
+                sleep(self.delay(attempt, e))
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+_RETRY_POLICY: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY
+
+
+def set_retry_policy(policy: Optional[RetryPolicy]) -> None:
+    """
+    Set retry policy that is used by client, None disables retries
+
+    :param policy: new retry policy
+    """
+    global _RETRY_POLICY
+    _RETRY_POLICY = policy
+
+
+def get_retry_policy() -> Optional[RetryPolicy]:
+    return _RETRY_POLICY
+
+
+def call_with_retry(
+    func: Callable[..., T],
+    *args: Any,
+    idempotent: bool = True,
+    **kwargs: Any,
+) -> T:
+    if _RETRY_POLICY is None:
+        return func(*args, **kwargs)
+
+    return _RETRY_POLICY.call(func, *args, idempotent=idempotent, **kwargs)
+
+
+__all__ = [
+    "DEFAULT_RETRY_POLICY",
+    "RETRYABLE_STATUSES",
+    "RetryPolicy",
+    "call_with_retry",
+    "get_retry_policy",
+    "retry_after",
+    "set_retry_policy",
+]
@@ -0,0 +1,31 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+
+class SQLiteStorage:
+    """
+    Base class for stores kept at SQLite database. Database is opened
+    in WAL mode, so it can be used by several threads and processes at once.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite connection can't be shared between threads
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+
+        return conn
+
+
+__all__ = [
+    "SQLiteStorage",
+]
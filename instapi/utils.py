@@ -1,9 +1,35 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
 from functools import partial
 from itertools import chain
-from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+from queue import Full, Queue
+from threading import Event, Thread
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    cast,
+)
 from uuid import uuid1
 
+from .checkpoint import Checkpoint, CheckpointStore
+from .types import StrDict
+
 T = TypeVar("T")
+R = TypeVar("R")
+
+# Biggest page that api returns, bigger page size hints are trimmed by server
+MAX_PAGE_SIZE = 200
 
 
 def fetch_key(source: Dict, key_path: str) -> Any:
@@ -16,26 +42,253 @@ def fetch_key(source: Dict, key_path: str) -> Any:
     return source
 
 
+_STOP = object()
+
+
+def prefetch(iterable: Iterable[T], depth: int = 1) -> Iterator[T]:
+    """
+    Iterate over iterable at background thread, so up to depth
+    items are fetched before they are requested. Background thread
+    starts with first requested item and stops when returned iterator
+    is closed or garbage collected.
+
+    :param iterable: source iterable
+    :param depth: how many items can be fetched ahead
+    :return: iterator with same items
+    """
+    if depth <= 0:
+        raise ValueError("Prefetch depth should be positive number")
+
+    items: "Queue[Any]" = Queue(maxsize=depth)
+    stopped = Event()
+
+    def _put(item: Any) -> bool:
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=0.1)
+            except Full:
+                continue
+
+            return True
+
+        return False
+
+    def _worker() -> None:
+        iterator = iter(iterable)
+
+        try:
+            for item in iterator:
+                if not _put((item, None)):
+                    break
+            else:
+                _put((_STOP, None))
+        except BaseException as e:
+            _put((_STOP, e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    context = copy_context()
+
+    def _consumer() -> Iterator[T]:
+        try:
+            # Thread is started on first request, so dropped iterator doesn't leak it
+            Thread(target=context.run, args=(_worker,), daemon=True).start()
+
+            while True:
+                item, error = items.get()
+
+                if error is not None:
+                    raise error
+                if item is _STOP:
+                    break
+
+                yield item
+        finally:
+            stopped.set()
+
+    return _consumer()
+
+
+def page_size_for(limit: Optional[int], max_size: int = MAX_PAGE_SIZE) -> int:
+    """
+    Get page size hint that is enough to fetch limit items,
+    all items are fetched with max pages
+
+    :param limit: how many items will be used, None means all items
+    :param max_size: max page size
+    :return: page size hint
+    """
+    if limit is None:
+        return max_size
+
+    return max(min(limit, max_size), 1)
+
+
+def parallel_map(
+    func: Callable[[T], R],
+    iterable: Iterable[T],
+    max_workers: int = 4,
+) -> Iterator[R]:
+    """
+    Apply func to items of iterable at thread pool. Iterable is consumed lazily,
+    at most 2 * max_workers items are scheduled at once. Results are returned
+    in same order as items.
+
+    :param func: function to apply
+    :param iterable: source iterable
+    :param max_workers: max number of threads
+    :return: iterator with results
+    """
+    if max_workers <= 0:
+        raise ValueError("Max workers should be positive number")
+
+    pending: Deque["Future[R]"] = deque()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for item in iterable:
+                pending.append(executor.submit(copy_context().run, func, item))
+
+                if len(pending) >= 2 * max_workers:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _iter_pages(
+    fetcher: Callable,
+    key: str,
+    key_path: str,
+    next_value: Any = None,
+) -> Iterator:
+    while True:
+        if next_value is not None:
+            result = fetcher(**{key: next_value})
+        else:
+            result = fetcher()
+
+        yield result
+
+        next_value = fetch_key(result, key_path)
+
+        if not next_value:
+            break
+
+
 def process_many(
     fetcher: Callable,
     pk: Optional[int] = None,
     with_rank_token: bool = False,
     key: str = "max_id",
     key_path: str = "next_max_id",
+    prefetch_depth: int = 0,
+    checkpoint: Optional[CheckpointStore] = None,
+    checkpoint_key: Optional[str] = None,
+    page_size: Optional[int] = None,
+    page_size_key: str = "count",
 ) -> Iterable:
-    next_value = None
+    """
+    Iterate over pages of paginated api
+
+    :param fetcher: api method
+    :param pk: pk of entity which is passed as first argument to fetcher
+    :param with_rank_token: pass rank_token to fetcher
+    :param key: name of argument that contains cursor of next page
+    :param key_path: path to cursor of next page at the response
+    :param prefetch_depth: how many next pages should be fetched at background thread
+    :param checkpoint: store where cursor is saved after each processed page,
+        iteration is resumed from saved cursor and checkpoint is removed when it is finished
+    :param checkpoint_key: key of checkpoint, by default it is name of fetcher and pk
+    :param page_size: how many items should be requested at single page,
+        should be passed only to endpoints that support it
+    :param page_size_key: name of argument that contains page size
+    :return: pages from api
+    """
+    if checkpoint is not None and checkpoint_key is None:
+        checkpoint_key = f"{fetcher.__name__}:{pk}"
+
+    saved = checkpoint.load(cast(str, checkpoint_key)) if checkpoint is not None else None
 
     if pk is not None:
         fetcher = partial(fetcher, pk)
 
+    if page_size is not None:
+        fetcher = partial(fetcher, **{page_size_key: page_size})
+
+    rank_token = None
+
+    if with_rank_token:
+        rank_token = saved.rank_token if saved and saved.rank_token else str(uuid1())
+        fetcher = partial(fetcher, rank_token=rank_token)
+
+    pages = _iter_pages(fetcher, key, key_path, saved.cursor if saved else None)
+
+    if prefetch_depth:
+        pages = prefetch(pages, prefetch_depth)
+
+    for page in pages:
+        yield page
+
+        # Page is considered processed only when next one is requested
+        if checkpoint is not None:
+            next_value = fetch_key(page, key_path)
+
+            if next_value:
+                checkpoint.save(cast(str, checkpoint_key), Checkpoint(str(next_value), rank_token))
+
+    if checkpoint is not None:
+        checkpoint.delete(cast(str, checkpoint_key))
+
+
+async def aprocess_many(
+    fetcher: Callable,
+    pk: Optional[int] = None,
+    with_rank_token: bool = False,
+    key: str = "max_id",
+    key_path: str = "next_max_id",
+    page_size: Optional[int] = None,
+    page_size_key: str = "count",
+) -> AsyncIterator:
+    """
+    Async version of process_many. Coroutine fetchers are awaited,
+    regular ones are called at default executor so event loop isn't blocked.
+
+    :param fetcher: api method
+    :param pk: pk of entity which is passed as first argument to fetcher
+    :param with_rank_token: pass rank_token to fetcher
+    :param key: name of argument that contains cursor of next page
+    :param key_path: path to cursor of next page at the response
+    :param page_size: how many items should be requested at single page
+    :param page_size_key: name of argument that contains page size
+    :return: pages from api
+    """
+    is_coroutine = asyncio.iscoroutinefunction(fetcher)
+
+    if pk is not None:
+        fetcher = partial(fetcher, pk)
+
+    if page_size is not None:
+        fetcher = partial(fetcher, **{page_size_key: page_size})
+
     if with_rank_token:
         fetcher = partial(fetcher, rank_token=str(uuid1()))
 
+    loop = asyncio.get_event_loop()
+    next_value = None
+
     while True:
-        if next_value is not None:
-            result = fetcher(**{key: next_value})
+        kwargs: StrDict = {key: next_value} if next_value is not None else {}
+
+        if is_coroutine:
+            result = await fetcher(**kwargs)
         else:
-            result = fetcher()
+            result = await loop.run_in_executor(None, partial(fetcher, **kwargs))
 
         yield result
 
@@ -45,6 +298,31 @@ def process_many(
             break
 
 
+async def ato_list(iterable: AsyncIterable[T], limit: Optional[int] = None) -> List[T]:
+    """
+    Collect items of async iterable into list
+
+    :param iterable: async iterable
+    :param limit: max size of resulting list
+    :return: list of items
+    """
+    if limit is not None and limit < 0:
+        raise ValueError("Limited can't handle negative numbers")
+
+    result: List[T] = []
+
+    if limit == 0:
+        return result
+
+    async for item in iterable:
+        result.append(item)
+
+        if len(result) == limit:
+            break
+
+    return result
+
+
 def limited(iterable: Iterable[T], limit: Optional[int] = None) -> Iterable[T]:
     if limit is None:
         yield from iterable
@@ -74,6 +352,12 @@ def join(iterable: Iterable, separator: str = ",") -> str:
 
 
 __all__ = [
+    "MAX_PAGE_SIZE",
+    "aprocess_many",
+    "ato_list",
+    "page_size_for",
+    "parallel_map",
+    "prefetch",
     "process_many",
     "limited",
     "to_list",
@@ -0,0 +1,208 @@
+import asyncio
+import json
+
+from instagram_private_api import ClientError
+from instagram_private_api.errors import (
+    ClientConnectionError,
+    ClientLoginRequiredError,
+)
+from pytest import fixture, mark, raises
+
+from instapi.client_api import AsyncClient, Client
+from instapi.client_api.async_direct import AsyncDirectEndpoint
+from instapi.client_api.async_media import AsyncMediaEndpoint
+from instapi.client_api.async_user import AsyncUserEndpoint
+
+from ..conftest import random_string
+
+
+class FakeResponse:
+    def __init__(self, status=200, body=None):
+        self.status = status
+        self.reason = "OK" if status < 400 else "Bad Request"
+        self.body = json.dumps({"status": "ok"} if body is None else body)
+
+    async def read(self):
+        return self.body.encode()
+
+    async def text(self):
+        return self.body
+
+    async def json(self, content_type=None):
+        return json.loads(self.body)
+
+
+@fixture
+def client(mocker):
+    mocker.patch("instagram_private_api.client.Client.login", return_value=None)
+    return Client(random_string(), random_string())
+
+
+@fixture
+def async_client(client):
+    return AsyncClient(client)
+
+
+@fixture
+def response():
+    return FakeResponse()
+
+
+@fixture
+def mock_request(mocker, async_client, response):
+    calls = mocker.Mock()
+
+    async def request(*args, **kwargs):
+        calls(*args, **kwargs)
+        return response
+
+    mocker.patch.object(async_client, "_get_session", return_value=mocker.Mock(request=request))
+
+    return calls
+
+
+def test_session_is_pooled(async_client):
+    async def _get_sessions():
+        async with async_client:
+            return async_client._get_session(), async_client._get_session()
+
+    first, second = asyncio.run(_get_sessions())
+
+    assert first is second
+    assert first.closed
+    assert async_client._session is None
+
+
+def test_keep_alive_headers(async_client):
+    assert "Connection" not in async_client.default_headers
+
+
+class TestCallApi:
+    def test_get(self, mock_request, async_client):
+        assert asyncio.run(async_client._call_api("test/", query={"a": "b"})) == {"status": "ok"}
+
+        (method, url), kwargs = mock_request.call_args
+        assert method == "GET"
+        assert url.endswith("/test/")
+        assert kwargs["params"] == {"a": "b"}
+        assert kwargs["data"] is None
+
+    def test_signed_post(self, mock_request, async_client):
+        asyncio.run(async_client._call_api("test/", params={"a": "b"}))
+
+        (method, _), kwargs = mock_request.call_args
+        assert method == "POST"
+        assert kwargs["data"]["signed_body"].endswith('.{"a":"b"}')
+
+    def test_unsigned_post(self, mock_request, async_client):
+        asyncio.run(async_client._call_api("test/", params={"a": "b"}, unsigned=True))
+
+        _, kwargs = mock_request.call_args
+        assert kwargs["data"] == {"a": "b"}
+
+    @mark.parametrize(
+        "status,body,exc",
+        [
+            [400, {"message": "error"}, ClientError],
+            [200, {"message": "login_required"}, ClientLoginRequiredError],
+            [200, {"status": "fail"}, ClientError],
+        ],
+    )
+    def test_errors(self, mock_request, async_client, response, status, body, exc):
+        response.status = status
+        response.body = json.dumps(body)
+
+        with raises(exc):
+            asyncio.run(async_client._call_api("test/"))
+
+    @mark.parametrize("error", [OSError("Connection refused"), asyncio.TimeoutError()])
+    def test_connection_error(self, mocker, async_client, error):
+        async def request(*args, **kwargs):
+            raise error
+
+        mocker.patch.object(async_client, "_get_session", return_value=mocker.Mock(request=request))
+
+        with raises(ClientConnectionError):
+            asyncio.run(async_client._call_api("test/"))
+
+
+class TestSendItem:
+    def test_send_item(self, mock_request, async_client):
+        data = asyncio.run(
+            async_client.direct_v2_send_item(
+                recipient_users=1,
+                thread_id=1,
+                item_type="text",
+                item_data={},
+            )
+        )
+
+        assert data == {"status": "ok"}
+
+        (method, _), kwargs = mock_request.call_args
+        assert method == "POST"
+        assert kwargs["data"]["thread_ids"] == "[1]"
+        assert kwargs["data"]["recipient_users"] == "[[1]]"
+
+    def test_send_item_raise_exception(self, mock_request, async_client, response):
+        response.status = 400
+
+        with raises(ClientError):
+            asyncio.run(
+                async_client.direct_v2_send_item(
+                    recipient_users=1,
+                    item_type="text",
+                    item_data={},
+                )
+            )
+
+
+@mark.parametrize(
+    "method,kwargs",
+    [
+        [AsyncDirectEndpoint.direct_v2_send_media_share, {"media_id": 1}],
+        [AsyncDirectEndpoint.direct_v2_send_hashtag, {"hashtag": ""}],
+        [AsyncDirectEndpoint.direct_v2_send_profile, {"profile_id": 1}],
+        [AsyncDirectEndpoint.direct_v2_send_link, {"link": ""}],
+        [AsyncDirectEndpoint.direct_v2_send_text, {"text": ""}],
+    ],
+)
+def test_custom_send(mocker, method, async_client, kwargs):
+    mock = mocker.Mock()
+
+    async def send_item(*args, **kwargs):
+        mock(*args, **kwargs)
+
+    mocker.patch.object(async_client, "direct_v2_send_item", send_item)
+    asyncio.run(method(async_client, **kwargs))
+
+    mock.assert_called_once()
+
+
+@mark.parametrize(
+    "method,args",
+    [
+        [AsyncDirectEndpoint.direct_v2_inbox, ()],
+        [AsyncDirectEndpoint.direct_v2_get_by_participants, (1,)],
+        [AsyncDirectEndpoint.direct_v2_thread, (1,)],
+        [AsyncUserEndpoint.current_user, ()],
+        [AsyncUserEndpoint.user_info, (1,)],
+        [AsyncUserEndpoint.username_info, ("username",)],
+        [AsyncUserEndpoint.user_detail_info, (1,)],
+        [AsyncUserEndpoint.user_feed, (1,)],
+        [AsyncUserEndpoint.user_story_feed, (1,)],
+        [AsyncUserEndpoint.user_followers, (1, "token")],
+        [AsyncUserEndpoint.user_following, (1, "token")],
+        [AsyncUserEndpoint.search_users, ("query",)],
+        [AsyncMediaEndpoint.media_info, (1,)],
+        [AsyncMediaEndpoint.medias_info, ("1",)],
+        [AsyncMediaEndpoint.medias_info, ([1, 2],)],
+        [AsyncMediaEndpoint.media_likers, (1,)],
+        [AsyncMediaEndpoint.media_comments, (1,)],
+        [AsyncMediaEndpoint.feed_timeline, ()],
+    ],
+)
+def test_call_api(mock_request, method, async_client, args):
+    assert asyncio.run(method(async_client, *args)) == {"status": "ok"}
+
+    mock_request.assert_called_once()
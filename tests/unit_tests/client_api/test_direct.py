@@ -33,7 +33,7 @@ class TestSendItem:
 
     @fixture
     def mock_post(self, mocker, response):
-        return mocker.patch("requests.post", return_value=response)
+        return mocker.patch("requests.Session.post", return_value=response)
 
     def test_send_item(self, mock_post, direct_endpoint, response):
         response.status_code = 200
@@ -76,6 +76,37 @@ class TestSendItem:
             )
 
 
+class TestSendSession:
+    def test_session_reused(self, direct_endpoint):
+        assert direct_endpoint.send_session is direct_endpoint.send_session
+
+    def test_session_pool(self, mocker):
+        mocker.patch("instagram_private_api.client.Client.login", return_value=None)
+        endpoint = DirectEndpoint(random_string(), random_string(), send_pool_maxsize=50)
+
+        adapter = endpoint.send_session.get_adapter(endpoint.api_url)
+
+        assert adapter._pool_maxsize == 50
+
+    def test_session_keep_alive(self, direct_endpoint):
+        headers = direct_endpoint.send_session.headers
+
+        assert "Connection" not in headers
+        assert headers["User-Agent"] == direct_endpoint.user_agent
+
+    def test_session_cookies(self, direct_endpoint):
+        assert direct_endpoint.send_session.cookies is direct_endpoint.cookie_jar
+
+    def test_close_send_session(self, mocker, direct_endpoint):
+        session = direct_endpoint.send_session
+        close = mocker.patch.object(session, "close")
+
+        direct_endpoint.close_send_session()
+
+        close.assert_called_once()
+        assert direct_endpoint.send_session is not session
+
+
 @mark.parametrize(
     "method,kwargs",
     [
@@ -1,13 +1,24 @@
+import asyncio
 from dataclasses import is_dataclass
 from functools import partial
 from random import choice, randint
 from string import ascii_letters
-from typing import Any, Callable, Dict, List, Type, TypeVar, Union
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Dict,
+    List,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from pytest import fixture
 
-from instapi import models
+from instapi import cache, models
 from instapi.client import ClientProxy
+from instapi.utils import ato_list
 
 T = TypeVar("T")
 
@@ -59,6 +70,16 @@ def random_url(extension: str = ".jpg"):
     return f"http://{random_string()}.com/{random_string()}{extension}"
 
 
+def collect(iterable: AsyncIterable[T]) -> List[T]:
+    """
+    Run event loop until async iterable is exhausted
+
+    :param iterable: async iterable
+    :return: list of items
+    """
+    return asyncio.run(ato_list(iterable))
+
+
 # Define default actions to do for different types
 TYPE_TO_ACTION: Dict[Type, Callable] = {
     bool: partial(choice, [True, False]),
@@ -129,3 +150,15 @@ def regular_client_mode():
     yield
 
     ClientProxy.is_testing = old_value
+
+
+@fixture(autouse=True)
+def clear_caches():
+    """
+    Fixture that clear in-memory caches after each test, entities are compared
+    by pk so random entities from different tests can share cached values
+    """
+    yield
+
+    for c in [*cache._CACHES]:
+        c.clear()
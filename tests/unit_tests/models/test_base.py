@@ -1,7 +1,8 @@
 from pytest import fixture, raises
 
-from instapi.models.base import BaseModel
-from tests.unit_tests.conftest import random_int, random_string
+from instapi.models import Media, User
+from instapi.models.base import BaseModel, Entity
+from tests.unit_tests.conftest import rand, random_int, random_string
 
 
 class TestBaseModel:
@@ -71,3 +72,53 @@ class TestEntity:
 
     def test_entity_support_int(self, entity):
         assert entity.pk == int(entity)
+
+    def test_entity_eq_by_pk(self, entity):
+        assert entity == Entity(pk=entity.pk)
+        assert entity != Entity(pk=entity.pk + 1)
+
+    def test_entity_eq_different_types(self):
+        assert User.create(rand(User, pk=1).as_dict()) != Media(pk=1)
+
+
+class TestIdentityMap:
+    """Tests for Entity identity map"""
+
+    @fixture(autouse=True)
+    def identity_map(self, mocker):
+        mocker.patch.object(Entity, "use_identity_map", True)
+
+    def test_same_instance(self):
+        data = rand(User).as_dict()
+
+        assert User.create(data) is User.create({**data})
+
+    def test_changed_data(self):
+        data = rand(User).as_dict()
+        first = User.create(data)
+
+        second = User.create({**data, "username": random_string()})
+
+        assert second is not first
+        assert User.create(second.as_dict()) is second
+
+    def test_different_classes(self):
+        pk = random_int()
+
+        assert Media.create({"pk": pk}) is not Entity.create({"pk": pk})
+
+    def test_disabled(self, mocker):
+        mocker.patch.object(Entity, "use_identity_map", False)
+        data = rand(User).as_dict()
+
+        assert User.create(data) is not User.create(data)
+
+    def test_per_class(self, mocker):
+        mocker.patch.object(Entity, "use_identity_map", False)
+        mocker.patch.object(User, "use_identity_map", True)
+
+        user = rand(User).as_dict()
+        media = rand(Media).as_dict()
+
+        assert User.create(user) is User.create(user)
+        assert Media.create(media) is not Media.create(media)
@@ -1,11 +1,12 @@
 from typing import Generator
 
-from pytest import fixture
+from instagram_private_api import ClientError
+from pytest import fixture, raises
 
 from instapi import Direct, Message, User
 from tests.unit_tests.models.conftest import as_dicts
 
-from ..conftest import random_int, random_string
+from ..conftest import collect, random_int, random_string
 
 
 def test_direct_create(user):
@@ -37,6 +38,9 @@ class TestDirects:
     def test_iter_direct(self, mock_inbox, directs):
         assert [*Direct.iter_directs()] == directs
 
+    def test_aiter_direct(self, mock_inbox, directs):
+        assert collect(Direct.aiter_directs()) == directs
+
     def test_direct(self, mock_inbox, directs):
         assert Direct.directs() == directs
 
@@ -69,6 +73,9 @@ class TestMessages:
     def test_iter_direct(self, mock_thread, direct, messages):
         assert [*direct.iter_message()] == messages
 
+    def test_aiter_direct(self, mock_thread, direct, messages):
+        assert collect(direct.aiter_message()) == messages
+
     def test_direct(self, mock_thread, direct, messages):
         assert direct.messages() == messages
 
@@ -161,3 +168,50 @@ def test_send_media(mocker, direct, feed):
         media_id=feed.pk,
         text=text,
     )
+
+
+class TestBroadcast:
+    @fixture
+    def mock_send(self, mocker):
+        return mocker.patch(
+            "instapi.client.client.direct_v2_send_text",
+            side_effect=lambda **kwargs: {"thread_id": kwargs["thread_id"]},
+        )
+
+    def test_broadcast_to_directs(self, mock_send, directs):
+        results = Direct.broadcast(directs, Direct.send_text, "text", max_workers=3)
+
+        assert [r.recipient for r in results] == directs
+        assert [r.direct for r in results] == directs
+        assert all(r.ok for r in results)
+        assert [r.response for r in results] == [{"thread_id": d.thread_id} for d in directs]
+        assert mock_send.call_count == len(directs)
+
+    def test_broadcast_to_users(self, mocker, mock_send, users, direct):
+        with_user = mocker.patch("instapi.models.direct.Direct.with_user", return_value=direct)
+
+        results = Direct.broadcast(users, Direct.send_text, text="text")
+
+        assert [r.recipient for r in results] == users
+        assert all(r.direct is direct for r in results)
+        assert with_user.call_count == len(users)
+
+    def test_broadcast_errors(self, mocker, directs):
+        error = ClientError("error")
+        failed = directs[0]
+
+        def send(**kwargs):
+            if kwargs["thread_id"] == failed.thread_id:
+                raise error
+
+        mocker.patch("instapi.client.client.direct_v2_send_text", side_effect=send)
+
+        results = Direct.broadcast(directs, Direct.send_text, "text")
+
+        assert [r.error for r in results if not r.ok] == [
+            error for d in directs if d.thread_id == failed.thread_id
+        ]
+
+    def test_broadcast_invalid_max_workers(self, directs):
+        with raises(ValueError):
+            Direct.broadcast(directs, Direct.send_text, "text", max_workers=0)
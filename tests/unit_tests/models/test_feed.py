@@ -1,6 +1,8 @@
 from pytest import fixture
 
-from ..conftest import random_int, random_string
+from instapi.models import Feed
+
+from ..conftest import collect, rand, random_int, random_string
 from .conftest import as_dicts
 
 
@@ -74,6 +76,9 @@ class TestFeed:
 
         assert unpack == users
 
+    def test_aiter_likes(self, mock_likers, feed, users):
+        assert collect(feed.aiter_likes()) == users
+
     def test_likes_without_limit(self, mock_likers, feed, users):
         likes = feed.likes()
 
@@ -90,6 +95,9 @@ class TestFeed:
 
         assert unpack == comments
 
+    def test_aiter_comments(self, mock_comments, feed, comments):
+        assert collect(feed.aiter_comments()) == comments
+
     def test_comments_without_limit(self, mock_comments, feed, comments):
         assert feed.comments() == comments
 
@@ -110,6 +118,22 @@ class TestFeed:
 
         assert feeds == feeds[:limit]
 
+    def test_timeline_media_info_from_payload(self, mocker, feed):
+        items = [
+            {**rand(Feed, pk=pk).as_dict(), "image_versions2": {"candidates": []}}
+            for pk in range(1, 6)
+        ]
+        mocker.patch(
+            "instapi.client.client.feed_timeline",
+            return_value={"feed_items": [{"media_or_ad": item} for item in items]},
+        )
+        media_info = mocker.patch("instapi.client.client.media_info")
+        medias_info = mocker.patch("instapi.client.client.medias_info")
+
+        assert [f._media_info() for f in feed.timeline()] == items
+        media_info.assert_not_called()
+        medias_info.assert_not_called()
+
     def test_caption(self, mocker, feed):
         caption = random_string()
         mocker.patch(
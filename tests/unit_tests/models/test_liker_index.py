@@ -0,0 +1,98 @@
+from pytest import fixture, raises
+
+from instapi.models import Feed, LikerIndex, User
+
+from ..conftest import rand
+
+
+@fixture
+def posts():
+    return [rand(Feed, pk=pk) for pk in range(1, 5)]
+
+
+@fixture
+def likers():
+    return [rand(User, pk=pk) for pk in range(1, 4)]
+
+
+@fixture
+def stranger():
+    return rand(User, pk=100)
+
+
+@fixture
+def index(posts, likers):
+    first, second, third = likers
+
+    index = LikerIndex()
+    index.add(posts[0], [first, second, third])
+    index.add(posts[1], [first, second])
+    index.add(posts[2], [first])
+    index.add(posts[3], [])
+
+    return index
+
+
+def test_build(mocker, posts, likers):
+    mocker.patch("instapi.models.Feed.iter_likes", return_value=likers)
+
+    index = LikerIndex.build(posts, max_workers=2)
+
+    assert index.posts == posts
+    assert index.likers() == likers
+    assert all(index.liked_by_user(u) == posts for u in likers)
+
+
+def test_len(index, posts):
+    assert len(index) == len(posts)
+
+
+def test_post_likers(index, posts, likers):
+    assert index.post_likers(posts[1]) == likers[:2]
+    assert index.post_likers(posts[3]) == []
+
+
+def test_liked_by_user(index, posts, likers, stranger):
+    first, second, third = likers
+
+    assert index.liked_by_user(first) == posts[:3]
+    assert index.liked_by_user(second) == posts[:2]
+    assert index.liked_by_user(third) == posts[:1]
+    assert index.liked_by_user(stranger) == []
+
+
+def test_liked_by_users(index, posts, likers):
+    first, second, _ = likers
+
+    assert index.liked_by_users([first, second]) == {first: posts[:3], second: posts[:2]}
+
+
+def test_liked_by_any(index, posts, likers, stranger):
+    _, second, third = likers
+
+    assert index.liked_by_any([second, third]) == posts[:2]
+    assert index.liked_by_any([stranger]) == []
+
+
+def test_liked_all(index, likers):
+    first, second, third = likers
+
+    assert index.liked_all() == []
+    assert index.liked_all(last=3) == [first]
+    assert index.liked_all(last=2) == [first, second]
+    assert index.liked_all(last=1) == [first, second, third]
+
+
+def test_liked_all_negative(index):
+    with raises(ValueError):
+        index.liked_all(last=-1)
+
+
+def test_user_liker_index(mocker, user, posts, likers):
+    mocker.patch("instapi.models.User.iter_feeds", return_value=iter(posts))
+    mocker.patch("instapi.models.Feed.iter_likes", return_value=likers)
+
+    index = user.liker_index(limit=2)
+
+    assert index.posts == posts[:2]
+    assert index.liked_all() == likers
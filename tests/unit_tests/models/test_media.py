@@ -1,4 +1,8 @@
-from ..conftest import random_string
+from pytest import fixture, raises
+
+from instapi.models import Media
+
+from ..conftest import rand, random_string
 
 
 class TestMedia:
@@ -20,3 +24,39 @@ class TestMedia:
         media.comment(text)
 
         comment_mock.assert_called_once_with(media.pk, text)
+
+
+class TestPrefetch:
+    @fixture
+    def medias(self):
+        return [rand(Media, pk=pk) for pk in range(1, 6)]
+
+    @fixture
+    def mock_medias_info(self, mocker, medias):
+        items = {str(m.pk): {"pk": m.pk, "caption": random_string()} for m in medias}
+
+        def medias_info(ids):
+            return {"items": [items[i] for i in ids]}
+
+        return mocker.patch("instapi.client.client.medias_info", side_effect=medias_info)
+
+    def test_prefetch(self, mocker, medias, mock_medias_info):
+        media_info_mock = mocker.patch("instapi.client.client.media_info")
+
+        Media.prefetch(medias, batch_size=2)
+
+        assert mock_medias_info.call_count == 3
+        assert [m._media_info()["pk"] for m in medias] == [m.pk for m in medias]
+        media_info_mock.assert_not_called()
+
+    def test_prefetch_skips_cached(self, medias, mock_medias_info):
+        first, *others = medias
+        Media._media_info.prime({"pk": first.pk}, first)
+
+        Media.prefetch(medias)
+
+        mock_medias_info.assert_called_once_with([str(m.pk) for m in others])
+
+    def test_prefetch_invalid_batch_size(self, medias):
+        with raises(ValueError):
+            Media.prefetch(medias, batch_size=0)
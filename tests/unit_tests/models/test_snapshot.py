@@ -0,0 +1,93 @@
+from time import time
+
+from pytest import fixture, raises
+
+from instapi.models import FollowersDiff, FollowersSnapshot, User
+from instapi.models.snapshot import update_snapshot
+
+from ..conftest import rand
+
+
+def _consumed(pks):
+    consumed = []
+
+    def gen():
+        for pk in pks:
+            consumed.append(pk)
+            yield pk
+
+    return gen(), consumed
+
+
+@fixture
+def snapshot():
+    return FollowersSnapshot(tuple(range(10, 0, -1)), time(), time())
+
+
+def test_first_run_is_full():
+    snapshot, diff = update_snapshot(None, [3, 2, 1])
+
+    assert snapshot.pks == (3, 2, 1)
+    assert diff == FollowersDiff(frozenset({1, 2, 3}), frozenset(), True)
+
+
+def test_early_stop(snapshot):
+    pks, consumed = _consumed([12, 11, 10, 8, 7, 6, 5, 4, 3, 2, 1])
+
+    new, diff = update_snapshot(snapshot, pks, overlap=3)
+
+    assert consumed == [12, 11, 10, 8, 7, 6]
+    assert diff == FollowersDiff(frozenset({11, 12}), frozenset({9}), False)
+    assert new.pks == (12, 11, 10, 8, 7, 6, 5, 4, 3, 2, 1)
+    assert new.verified == snapshot.verified
+
+
+def test_exhausted_is_full(snapshot):
+    new, diff = update_snapshot(snapshot, [11, 10, 1], overlap=3)
+
+    assert diff == FollowersDiff(frozenset({11}), frozenset(range(2, 10)), True)
+    assert new.pks == (11, 10, 1)
+
+
+def test_scheduled_verification(snapshot):
+    snapshot = FollowersSnapshot(snapshot.pks, snapshot.created, time() - 100)
+    pks, consumed = _consumed([10, 9, 8, 7, 6, 5, 4, 3, 2])
+
+    new, diff = update_snapshot(snapshot, pks, overlap=3, verify_interval=50)
+
+    assert len(consumed) == 9
+    assert diff == FollowersDiff(frozenset(), frozenset({1}), True)
+    assert new.verified > snapshot.verified
+
+
+def test_invalid_overlap(snapshot):
+    with raises(ValueError):
+        update_snapshot(snapshot, [], overlap=0)
+
+
+def test_save_load(tmp_path, snapshot):
+    path = tmp_path / "snapshot.json"
+
+    assert FollowersSnapshot.load(path) is None
+
+    snapshot.save(path)
+
+    assert FollowersSnapshot.load(path) == snapshot
+
+
+def test_user_followers_diff(mocker, tmp_path):
+    user = rand(User)
+    path = tmp_path / "snapshot.json"
+
+    followers = [rand(User, pk=pk) for pk in range(5, 0, -1)]
+    mocker.patch("instapi.models.User.iter_followers", return_value=followers)
+
+    assert user.followers_diff(path).added == frozenset(range(1, 6))
+
+    new = rand(User, pk=6)
+    mocker.patch("instapi.models.User.iter_followers", return_value=[new, *followers[1:]])
+
+    diff = user.followers_diff(path, overlap=2)
+
+    assert diff == FollowersDiff(frozenset({6}), frozenset({5}), False)
+    assert FollowersSnapshot.load(path).pks == (6, 4, 3, 2, 1)
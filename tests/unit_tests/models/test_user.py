@@ -1,13 +1,15 @@
 from collections import Counter
 from typing import Iterable, List
 
-from pytest import fixture, raises
+from instagram_private_api import ClientError
+from pytest import fixture, mark, raises
 
 from instapi.models import Feed, User
 from instapi.models.resource import Resources
-from instapi.utils import flat
+from instapi.pkset import PkSet
+from instapi.utils import MAX_PAGE_SIZE, flat
 
-from ..conftest import random_int, random_string
+from ..conftest import collect, random_int, random_string
 from .conftest import as_dicts, create_users
 
 
@@ -63,6 +65,21 @@ def test_user_from_username(user, mocker):
     username_info_mock.assert_called_once_with(user.username)
 
 
+def test_user_from_username_not_found(mocker):
+    """Test for User.from_username classmethod with deleted user"""
+    username_info_mock = mocker.patch(
+        "instapi.client.client.username_info",
+        side_effect=ClientError("Not Found", code=404),
+    )
+    username = random_string()
+
+    for _ in range(2):
+        with raises(ClientError):
+            User.from_username(username)
+
+    username_info_mock.assert_called_once_with(username)
+
+
 def test_user_match_username(user, mocker):
     """Test for User.match_username classmethod"""
     list_of_users = create_users(length=50)
@@ -230,11 +247,17 @@ def test_followers(mocker, user, users):
     follow_mock.assert_called_once()
     assert follow_mock.call_args[0][0] == user.pk
 
+    _, kwargs = follow_mock.call_args
+    assert kwargs["count"] == MAX_PAGE_SIZE
+
     follow_mock.reset_mock()
 
     limit = len(users) - len(users) // 2
     assert user.followers(limit=limit) == users[:limit]
 
+    _, kwargs = follow_mock.call_args
+    assert kwargs["count"] == limit
+
 
 def test_followings(mocker, user, users):
     """
@@ -256,11 +279,53 @@ def test_followings(mocker, user, users):
     follow_mock.assert_called_once()
     assert follow_mock.call_args[0][0] == user.pk
 
+    _, kwargs = follow_mock.call_args
+    assert kwargs["count"] == MAX_PAGE_SIZE
+
     follow_mock.reset_mock()
 
     limit = len(users) - len(users) // 2
     assert user.followings(limit=limit) == users[:limit]
 
+    _, kwargs = follow_mock.call_args
+    assert kwargs["count"] == limit
+
+
+@mark.parametrize(
+    "method,fetcher", [["follower_pks", "user_followers"], ["following_pks", "user_following"]]
+)
+def test_follow_pks(mocker, user, users, method, fetcher):
+    """
+    Test for:
+    User.follower_pks method
+    User.following_pks method
+    """
+    follow_mock = mocker.patch(
+        f"instapi.client.client.{fetcher}", return_value={"users": as_dicts(users)}
+    )
+
+    assert getattr(user, method)() == PkSet(u.pk for u in users)
+    assert follow_mock.call_args[0][0] == user.pk
+
+    _, kwargs = follow_mock.call_args
+    assert kwargs["count"] == MAX_PAGE_SIZE
+
+
+def test_aiter_followers(mocker, user, users):
+    """Test for User.aiter_followers method"""
+    follow_mock = mocker.patch(
+        "instapi.client.client.user_followers", return_value={"users": as_dicts(users)}
+    )
+
+    assert collect(user.aiter_followers()) == users
+    follow_mock.assert_called_once()
+    assert follow_mock.call_args[0][0] == user.pk
+
+
+def test_aiter_feeds(mock_feeds, user, feeds):
+    """Test for User.aiter_feeds method"""
+    assert collect(user.aiter_feeds()) == feeds
+
 
 def test_feeds(mock_feeds, user, feeds):
     """
@@ -272,6 +337,9 @@ def test_feeds(mock_feeds, user, feeds):
     assert [*user.iter_feeds()] == feeds
     assert user.feeds() == feeds
 
+    _, kwargs = mock_feeds.call_args
+    assert kwargs["count"] == MAX_PAGE_SIZE
+
     limit = len(feeds) - len(feeds) // 2
     assert user.feeds(limit=limit) == feeds[:limit]
 
@@ -302,6 +370,25 @@ def test_likes(mocker, mock_feeds, user, users, feeds):
     assert user.likes_statistic() == Counter(expected)
 
 
+def test_likes_parallel(mocker, mock_feeds, feeds, user, users):
+    """
+    Test for:
+    User.likes_chain with max_workers
+    User.likes_statistic with max_workers and on_progress
+    """
+    mocker.patch("instapi.models.Feed.iter_likes", return_value=users)
+    expected = flat([users] * len(feeds))
+    on_progress = mocker.Mock()
+
+    assert [*user.likes_chain(max_workers=4)] == expected
+    assert user.likes_statistic(max_workers=4, on_progress=on_progress) == Counter(expected)
+
+    assert on_progress.call_count == len(feeds)
+    processed, statistic = on_progress.call_args[0]
+    assert processed == len(feeds)
+    assert statistic == Counter(expected)
+
+
 def test_liked_by(mocker, mock_feeds, feeds, user, users):
     """
     Test for:
@@ -367,3 +454,37 @@ def test_stories(user, mocker, stories):
 
     assert user.stories(limit=limit) == stories[:limit]
     story_mock.assert_called_once_with(user.pk)
+
+
+def test_iter_followers_checkpoint(mocker, user):
+    checkpoint = mocker.Mock()
+    mock = mocker.patch("instapi.models.user.process_many", return_value=[])
+
+    _ = [*user.iter_followers(checkpoint=checkpoint)]
+
+    _, kwargs = mock.call_args
+    assert kwargs["checkpoint"] is checkpoint
+
+
+def test_resources_seeded_from_user_feed(mocker, user, feeds, images, videos):
+    """Test for: resources are taken from user_feed payload without media_info calls"""
+    (image,), (video,) = images, videos
+    items = [{**f.as_dict(), **(image if i % 2 else video).as_dict()} for i, f in enumerate(feeds)]
+
+    mocker.patch("instapi.client.client.user_feed", return_value={"items": items})
+    media_info_mock = mocker.patch("instapi.client.client.media_info")
+
+    assert user.images() == [image] * (len(feeds) // 2)
+    assert user.videos() == [video] * (len(feeds) - len(feeds) // 2)
+    media_info_mock.assert_not_called()
+
+
+def test_iter_videos_is_lazy(mocker, user, feed, videos):
+    def iter_feeds():
+        yield feed
+        raise AssertionError("Only first feed should be fetched")
+
+    mocker.patch("instapi.models.User.iter_feeds", side_effect=iter_feeds)
+    mocker.patch("instapi.models.Feed.iter_videos", return_value=iter(videos))
+
+    assert next(iter(user.iter_videos())) == videos[0]
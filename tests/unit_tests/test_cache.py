@@ -0,0 +1,629 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Timer
+from time import monotonic, sleep
+
+from pytest import fixture, raises
+
+from instapi.cache import (
+    CACHED_TIME,
+    LATENCY_BUCKETS,
+    CacheStats,
+    _Call,
+    cache_stats,
+    cached,
+    disable_persistent_cache,
+    enable_persistent_cache,
+)
+from instapi.models import Feed
+
+from .conftest import rand, random_int
+
+
+@fixture
+def func(mocker):
+    return mocker.Mock(side_effect=lambda *args, **kwargs: object())
+
+
+@fixture
+def mock_time(mocker):
+    mock = mocker.patch("instapi.cache.time", return_value=0)
+    return mock
+
+
+class TestCached:
+    """Tests for cached decorator"""
+
+    def test_cached_result(self, func):
+        wrapper = cached(func)
+        value = random_int()
+
+        assert wrapper(value) is wrapper(value)
+        func.assert_called_once_with(value)
+
+    def test_cached_with_options(self, func):
+        wrapper = cached(max_entries=10)(func)
+
+        assert wrapper(1) is wrapper(1)
+        func.assert_called_once_with(1)
+
+    def test_cached_expired(self, func, mock_time):
+        wrapper = cached(func)
+        first = wrapper(1)
+
+        mock_time.return_value = CACHED_TIME.get() + 1
+
+        assert wrapper(1) is not first
+        assert func.call_count == 2
+        assert len(wrapper.info().keys) == 1
+
+    def test_clear(self, func):
+        wrapper = cached(func)
+        first = wrapper(1)
+
+        wrapper.clear()
+
+        assert wrapper(1) is not first
+        assert func.call_count == 2
+
+    def test_prime(self, func):
+        wrapper = cached(func)
+        value = object()
+
+        wrapper.prime(value, 1)
+
+        assert wrapper(1) is value
+        func.assert_not_called()
+
+    def test_max_entries_lru(self, func):
+        wrapper = cached(max_entries=2)(func)
+
+        first = wrapper(1)
+        wrapper(2)
+
+        # 1 was used recently so 2 should be evicted
+        assert wrapper(1) is first
+        wrapper(3)
+
+        assert [*wrapper.info().cache] == [((1,), ()), ((3,), ())]
+
+    def test_evicted_keys_dropped(self, func):
+        wrapper = cached(max_entries=10)(func)
+
+        for i in range(1000):
+            wrapper(i)
+
+        info = wrapper.info()
+
+        assert len(info.cache) == 10
+        assert len(info.keys) <= 2 * len(info.cache)
+        assert {key for key, _ in info.keys} >= {*info.cache}
+
+    def test_max_bytes(self):
+        wrapper = cached(max_bytes=4096)(lambda size: "a" * size)
+
+        wrapper(1000)
+        wrapper(1001)
+        assert len(wrapper.info().cache) == 2
+
+        wrapper(3000)
+        assert [*wrapper.info().cache] == [((3000,), ())]
+
+        wrapper(5000)
+        assert not wrapper.info().cache
+
+    def test_invalid_limits(self, func):
+        with raises(ValueError):
+            cached(max_entries=0)(func)
+
+        with raises(ValueError):
+            cached(max_bytes=-1)(func)
+
+
+class TestPersistentCache:
+    """Tests for cached decorator with on-disk cache"""
+
+    @fixture(autouse=True)
+    def persistent_cache(self, tmp_path):
+        enable_persistent_cache(tmp_path / "cache.sqlite3")
+        yield
+        disable_persistent_cache()
+
+    def test_persistent_shared_between_wrappers(self, mocker):
+        func = mocker.Mock(return_value={"value": random_int()})
+
+        first = cached(persistent=True)(func)
+        second = cached(persistent=True)(func)
+
+        assert first(1) == second(1)
+        func.assert_called_once_with(1)
+
+        # Value should be moved to memory cache
+        assert ((1,), ()) in second.info().cache
+
+    def test_persistent_expired(self, mocker, mock_time):
+        func = mocker.Mock(return_value=random_int())
+
+        cached(persistent=True)(func)(1)
+        mock_time.return_value = CACHED_TIME.get() + 1
+        cached(persistent=True)(func)(1)
+
+        assert func.call_count == 2
+
+    def test_entity_key_by_pk(self, mocker):
+        func = mocker.Mock(return_value=random_int())
+        first, second = rand(Feed, pk=1), rand(Feed, pk=1)
+
+        cached(persistent=True)(func)(first)
+        cached(persistent=True)(func)(second)
+
+        func.assert_called_once_with(first)
+
+    def test_not_persistent(self, mocker):
+        func = mocker.Mock(return_value=random_int())
+
+        cached(func)(1)
+        cached(func)(1)
+
+        assert func.call_count == 2
+
+    def test_disabled(self, mocker):
+        disable_persistent_cache()
+        func = mocker.Mock(return_value=random_int())
+
+        cached(persistent=True)(func)(1)
+        cached(persistent=True)(func)(1)
+
+        assert func.call_count == 2
+
+    def test_not_picklable(self, mocker):
+        func = mocker.Mock(return_value=lambda: None)
+
+        wrapper = cached(persistent=True)(func)
+        assert wrapper(1) is wrapper(1)
+
+        cached(persistent=True)(func)(1)
+        assert func.call_count == 2
+
+
+class TestCachedThreads:
+    """Tests for cached decorator used from multiple threads"""
+
+    THREADS = 16
+
+    def _wait_for_waiters(self, waiters):
+        # All threads except one should wait for result of the first call
+        deadline = monotonic() + 5
+
+        while waiters.call_count < self.THREADS - 1 and monotonic() < deadline:
+            sleep(0.001)
+
+    def test_single_call(self, mocker):
+        event = Event()
+
+        def func(value):
+            event.wait(timeout=5)
+            return object()
+
+        mock = mocker.Mock(side_effect=func)
+        wrapper = cached(mock)
+
+        waiters = mocker.spy(_Call, "result")
+
+        with ThreadPoolExecutor(self.THREADS) as pool:
+            futures = [pool.submit(wrapper, 1) for _ in range(self.THREADS)]
+            self._wait_for_waiters(waiters)
+            event.set()
+
+        first, *others = [f.result() for f in futures]
+
+        assert all(first is other for other in others)
+        mock.assert_called_once_with(1)
+        assert not wrapper.info().calls
+
+    def test_error_propagated_and_not_cached(self, mocker):
+        event = Event()
+
+        def func(value):
+            event.wait(timeout=5)
+            raise RuntimeError(value)
+
+        mock = mocker.Mock(side_effect=func)
+        wrapper = cached(mock)
+
+        waiters = mocker.spy(_Call, "result")
+
+        with ThreadPoolExecutor(self.THREADS) as pool:
+            futures = [pool.submit(wrapper, 1) for _ in range(self.THREADS)]
+            self._wait_for_waiters(waiters)
+            event.set()
+
+        for f in futures:
+            with raises(RuntimeError):
+                f.result()
+
+        assert mock.call_count == 1
+        assert not wrapper.info().cache
+        assert not wrapper.info().calls
+
+        event.clear()
+        mock.side_effect = None
+        mock.return_value = random_int()
+
+        assert wrapper(1) == mock.return_value
+
+    def test_recursive_call(self):
+        calls = []
+
+        @cached
+        def func(value):
+            calls.append(value)
+
+            if len(calls) == 1:
+                return func(value)
+
+            return value
+
+        assert func(1) == 1
+        assert calls == [1, 1]
+
+
+class TestCachedAsync:
+    """Tests for cached decorator applied to coroutine functions"""
+
+    def test_awaited_value_cached(self, mocker):
+        mock = mocker.Mock(side_effect=lambda value: object())
+
+        @cached
+        async def func(value):
+            return mock(value)
+
+        async def main():
+            return await func(1), await func(1)
+
+        first, second = asyncio.run(main())
+
+        assert first is second
+        mock.assert_called_once_with(1)
+        assert ((1,), ()) in func.info().cache
+
+    def test_concurrent_tasks_share_call(self, mocker):
+        mock = mocker.Mock(side_effect=lambda value: object())
+
+        @cached
+        async def func(value):
+            await asyncio.sleep(0.01)
+            return mock(value)
+
+        async def main():
+            return await asyncio.gather(*[func(1) for _ in range(10)])
+
+        first, *others = asyncio.run(main())
+
+        assert all(first is other for other in others)
+        mock.assert_called_once_with(1)
+        assert not func.info().calls
+
+    def test_error_not_cached(self, mocker):
+        mock = mocker.Mock(side_effect=RuntimeError)
+
+        @cached
+        async def func(value):
+            await asyncio.sleep(0.01)
+            return mock(value)
+
+        async def main():
+            return await asyncio.gather(*[func(1) for _ in range(10)], return_exceptions=True)
+
+        results = asyncio.run(main())
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        mock.assert_called_once_with(1)
+        assert not func.info().cache
+        assert not func.info().calls
+
+
+class TestCacheStats:
+    """Tests for cached functions statistics"""
+
+    def test_hits_and_misses(self, func):
+        wrapper = cached(func)
+
+        wrapper(1)
+        wrapper(1)
+        wrapper(2)
+
+        stats = wrapper.info().stats
+
+        assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+        assert stats.hit_rate == 1 / 3
+        assert sum(stats.latency) == 2
+
+    def test_expirations(self, func, mock_time):
+        wrapper = cached(func)
+        wrapper(1)
+
+        mock_time.return_value = CACHED_TIME.get() + 1
+        wrapper(1)
+
+        stats = wrapper.info().stats
+        assert (stats.expirations, stats.misses, stats.size) == (1, 2, 1)
+
+    def test_evictions(self, func):
+        wrapper = cached(max_entries=1)(func)
+
+        wrapper(1)
+        wrapper(2)
+
+        stats = wrapper.info().stats
+        assert (stats.evictions, stats.size) == (1, 1)
+
+    def test_latency_buckets(self):
+        stats = CacheStats()
+
+        stats.add_latency(0)
+        stats.add_latency(0.3)
+        stats.add_latency(100)
+
+        assert stats.latency[0] == 1
+        assert stats.latency[LATENCY_BUCKETS.index(0.5)] == 1
+        assert stats.latency[-1] == 1
+
+    def test_registry(self):
+        @cached
+        def func(value):
+            return value
+
+        func(1)
+
+        stats = cache_stats()[f"{__name__}.{func.__qualname__}"]
+        assert (stats.misses, stats.size) == (1, 1)
+
+    def test_empty_hit_rate(self):
+        assert CacheStats().hit_rate == 0
+
+
+class TestCacheKeys:
+    """Tests for cached keys and ttl"""
+
+    def test_arguments_normalized(self, mocker):
+        mock = mocker.Mock()
+
+        @cached
+        def func(a, x=2, *, y=3):
+            return mock(a, x, y)
+
+        func(1)
+        func(1, 2)
+        func(1, x=2)
+        func(x=2, a=1)
+        func(1, y=3, x=2)
+
+        mock.assert_called_once_with(1, 2, 3)
+        assert [*func.info().cache] == [((1, 2), (("y", 3),))]
+
+    def test_positional_fast_path(self, mocker):
+        mock = mocker.Mock()
+
+        @cached
+        def func(a, b):
+            return mock(a, b)
+
+        func(1, 2)
+        func(b=2, a=1)
+
+        mock.assert_called_once_with(1, 2)
+
+    def test_unhashable_default(self, mocker):
+        mock = mocker.Mock()
+
+        @cached
+        def func(a, b=[]):  # noqa: B006
+            return mock(a, b)
+
+        func(1)
+        func(1)
+
+        mock.assert_called_once_with(1, [])
+        assert [*func.info().cache] == [((1,), ())]
+
+    def test_invalid_arguments(self):
+        @cached
+        def func(a):
+            return a
+
+        with raises(TypeError):
+            func(1, 2)
+
+    def test_ttl(self, func, mock_time):
+        wrapper = cached(ttl=CACHED_TIME.get() * 2)(func)
+        first = wrapper(1)
+
+        mock_time.return_value = CACHED_TIME.get() + 1
+        assert wrapper(1) is first
+
+        mock_time.return_value = CACHED_TIME.get() * 2 + 1
+        assert wrapper(1) is not first
+
+    def test_invalid_ttl(self, func):
+        with raises(ValueError):
+            cached(ttl=0)(func)
+
+
+class TestStaleWhileRevalidate:
+    """Tests for cached decorator with stale_ttl"""
+
+    TTL = 10
+
+    def test_stale_value_returned(self, func, mock_time):
+        wrapper = cached(ttl=self.TTL, stale_ttl=self.TTL)(func)
+        first = wrapper(1)
+
+        mock_time.return_value = self.TTL + 1
+        assert wrapper(1) is first
+
+        call = wrapper.info().calls.get(((1,), ()))
+        if call is not None:
+            call.result(timeout=5)
+
+        assert func.call_count == 2
+
+        second = wrapper(1)
+        assert second is not first
+        assert wrapper(1) is second
+
+        assert wrapper.info().stats.stale_hits == 1
+
+    def test_too_stale_value(self, func, mock_time):
+        wrapper = cached(ttl=self.TTL, stale_ttl=self.TTL)(func)
+        first = wrapper(1)
+
+        mock_time.return_value = self.TTL * 2 + 1
+
+        assert wrapper(1) is not first
+        assert func.call_count == 2
+
+    def test_queued_revalidation_is_waited(self, mocker, func, mock_time):
+        busy = Event()
+        pool = ThreadPoolExecutor(1)
+        mocker.patch("instapi.cache._get_revalidate_executor", return_value=pool)
+
+        wrapper = cached(ttl=self.TTL, stale_ttl=self.TTL)(func)
+        wrapper(1)
+
+        # Revalidation stays at queue while worker is busy
+        pool.submit(busy.wait, 5)
+        mock_time.return_value = self.TTL + 1
+        wrapper(1)
+
+        # Entry is gone, but same thread should wait for queued call instead of calling func
+        mock_time.return_value = self.TTL * 2 + 1
+        Timer(0.05, busy.set).start()
+
+        result = wrapper(1)
+        pool.shutdown()
+
+        assert result is wrapper.info().cache[((1,), ())].value
+        assert func.call_count == 2
+
+    def test_revalidate_error(self, mocker, mock_time):
+        func = mocker.Mock(side_effect=[1, RuntimeError])
+        wrapper = cached(ttl=self.TTL, stale_ttl=self.TTL)(func)
+        wrapper(1)
+
+        mock_time.return_value = self.TTL + 1
+        assert wrapper(1) == 1
+
+        call = wrapper.info().calls.get(((1,), ()))
+        if call is not None:
+            with raises(RuntimeError):
+                call.result(timeout=5)
+
+        assert wrapper(1) == 1
+
+    def test_async_stale_value_returned(self, mocker, mock_time):
+        mock = mocker.Mock(side_effect=lambda value: object())
+
+        @cached(ttl=self.TTL, stale_ttl=self.TTL)
+        async def func(value):
+            return mock(value)
+
+        async def main():
+            first = await func(1)
+            mock_time.return_value = self.TTL + 1
+
+            assert await func(1) is first
+
+            await asyncio.sleep(0)
+            assert await func(1) is not first
+
+        asyncio.run(main())
+        assert mock.call_count == 2
+
+    def test_async_revalidate_error(self, mocker, mock_time):
+        mock = mocker.Mock(side_effect=[1, RuntimeError])
+
+        @cached(ttl=self.TTL, stale_ttl=self.TTL)
+        async def func(value):
+            return mock(value)
+
+        async def main():
+            await func(1)
+            mock_time.return_value = self.TTL + 1
+
+            assert await func(1) == 1
+            await asyncio.sleep(0)
+            assert await func(1) == 1
+
+        asyncio.run(main())
+
+    def test_invalid_stale_ttl(self, func):
+        with raises(ValueError):
+            cached(stale_ttl=-1)(func)
+
+
+class TestCachedErrors:
+    """Tests for cached decorator with cache_errors"""
+
+    def test_error_cached(self, mocker):
+        func = mocker.Mock(side_effect=KeyError)
+        wrapper = cached(cache_errors=KeyError)(func)
+
+        for _ in range(3):
+            with raises(KeyError):
+                wrapper(1)
+
+        func.assert_called_once_with(1)
+
+    def test_error_not_selected(self, mocker):
+        func = mocker.Mock(side_effect=RuntimeError)
+        wrapper = cached(cache_errors=(KeyError, ValueError))(func)
+
+        for _ in range(3):
+            with raises(RuntimeError):
+                wrapper(1)
+
+        assert func.call_count == 3
+
+    def test_error_predicate(self, mocker):
+        func = mocker.Mock(side_effect=[ValueError("skip"), ValueError("cache"), 1])
+        wrapper = cached(cache_errors=lambda e: str(e) == "cache")(func)
+
+        with raises(ValueError, match="skip"):
+            wrapper(1)
+
+        for _ in range(2):
+            with raises(ValueError, match="cache"):
+                wrapper(1)
+
+        assert func.call_count == 2
+
+    def test_errors_ttl(self, mocker, mock_time):
+        func = mocker.Mock(side_effect=[KeyError, 1])
+        wrapper = cached(ttl=100, stale_ttl=100, cache_errors=KeyError, errors_ttl=10)(func)
+
+        with raises(KeyError):
+            wrapper(1)
+
+        # Expired errors should not be returned as stale values
+        mock_time.return_value = 11
+        assert wrapper(1) == 1
+
+    def test_async_error_cached(self, mocker):
+        mock = mocker.Mock(side_effect=KeyError)
+
+        @cached(cache_errors=KeyError)
+        async def func(value):
+            return mock(value)
+
+        async def main():
+            for _ in range(3):
+                with raises(KeyError):
+                    await func(1)
+
+        asyncio.run(main())
+        mock.assert_called_once_with(1)
+
+    def test_invalid_errors_ttl(self, func):
+        with raises(ValueError):
+            cached(cache_errors=KeyError, errors_ttl=0)(func)
@@ -0,0 +1,93 @@
+from pytest import fixture, raises
+
+from instapi.checkpoint import (
+    Checkpoint,
+    FileCheckpointStore,
+    SQLiteCheckpointStore,
+)
+from instapi.utils import process_many
+
+
+@fixture(params=[FileCheckpointStore, SQLiteCheckpointStore])
+def store(request, tmp_path):
+    return request.param(tmp_path / "checkpoints")
+
+
+class TestCheckpointStore:
+    def test_load_missing(self, store):
+        assert store.load("key") is None
+
+    def test_save_and_load(self, store):
+        checkpoint = Checkpoint("cursor", "token")
+        store.save("key", checkpoint)
+
+        assert store.load("key") == checkpoint
+        assert store.load("other") is None
+
+    def test_overwrite(self, store):
+        store.save("key", Checkpoint("first"))
+        store.save("key", Checkpoint("second"))
+
+        assert store.load("key") == Checkpoint("second")
+
+    def test_delete(self, store):
+        store.save("key", Checkpoint("cursor"))
+        store.delete("key")
+        store.delete("missing")
+
+        assert store.load("key") is None
+
+    def test_persisted(self, store):
+        store.save("key", Checkpoint("cursor", "token"))
+
+        assert type(store)(store.path).load("key") == Checkpoint("cursor", "token")
+
+
+class TestProcessManyCheckpoint:
+    @fixture
+    def pages(self):
+        return [{"next_max_id": "1"}, {"next_max_id": "2"}, {}]
+
+    @fixture
+    def fetcher(self, mocker, pages):
+        mock = mocker.Mock(side_effect=pages)
+        mock.__name__ = "user_followers"
+
+        return mock
+
+    def test_checkpoint_saved_after_page_processed(self, fetcher, store):
+        pages = iter(process_many(fetcher, 1, checkpoint=store))
+
+        next(pages)
+        assert store.load("user_followers:1") is None
+
+        next(pages)
+        assert store.load("user_followers:1") == Checkpoint("1")
+
+    def test_checkpoint_deleted_when_finished(self, fetcher, store, pages):
+        assert [*process_many(fetcher, 1, checkpoint=store)] == pages
+        assert store.load("user_followers:1") is None
+
+    def test_resume(self, fetcher, store):
+        fetcher.side_effect = [{}]
+        store.save("user_followers:1", Checkpoint("2", "token"))
+
+        assert [*process_many(fetcher, 1, with_rank_token=True, checkpoint=store)] == [{}]
+        fetcher.assert_called_once_with(1, rank_token="token", max_id="2")
+
+    def test_rank_token_saved(self, fetcher, store):
+        pages = iter(process_many(fetcher, 1, with_rank_token=True, checkpoint=store))
+        next(pages)
+        next(pages)
+
+        _, kwargs = fetcher.call_args
+        assert store.load("user_followers:1") == Checkpoint("1", kwargs["rank_token"])
+
+    def test_crash(self, mocker, store):
+        fetcher = mocker.Mock(side_effect=[{"next_max_id": "1"}, RuntimeError()])
+
+        with raises(RuntimeError):
+            for _ in process_many(fetcher, checkpoint=store, checkpoint_key="key"):
+                pass
+
+        assert store.load("key") == Checkpoint("1")
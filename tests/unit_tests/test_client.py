@@ -1,7 +1,8 @@
 from instagram_private_api import Client
 from pytest import mark, raises
 
-from instapi.client import bind, client
+from instapi.client import async_client, bind, client
+from instapi.client_api import AsyncClient
 from instapi.exceptions import ClientNotInitedException
 from instapi.models import User
 
@@ -39,3 +40,23 @@ def test_client_inited_after_bind(mocker):
 def test_bind_with_no_arguments():
     with raises(ValueError):
         bind()
+
+
+@mark.usefixtures("regular_client_mode")
+def test_bind_async(mocker):
+    mocker.patch("instagram_private_api.client.Client.__init__", return_value=None)
+    mocker.patch("instagram_private_api.client.Client.cookie_jar")
+    mocker.patch("instapi.cache.get_from_cache", return_value=None)
+    mocker.patch("instapi.cache.write_to_cache", return_value=None)
+    mocker.patch.object(async_client, "obj", None)
+
+    bind(random_string(), random_string(), use_async=True)
+
+    assert isinstance(async_client.obj, AsyncClient)
+    assert async_client.obj.client is client.obj
+
+
+def test_async_client_fallback(mocker):
+    mock = mocker.patch("instapi.client.client.user_info")
+
+    assert async_client.user_info is mock
@@ -0,0 +1,149 @@
+from instagram_private_api import ClientError
+from pytest import fixture, mark, raises
+
+from instapi.crawler import (
+    FOLLOWERS,
+    FOLLOWINGS,
+    Edge,
+    GraphCrawler,
+    MemoryCrawlState,
+    SQLiteCrawlState,
+)
+from instapi.models import User
+
+from .conftest import rand
+
+# pk -> followers
+FOLLOWERS_GRAPH = {
+    1: [2, 3],
+    2: [1, 4],
+    3: [4],
+    4: [5],
+    5: [],
+}
+
+
+def _followers(pk, **kwargs):
+    return {"users": [{"pk": other} for other in FOLLOWERS_GRAPH[pk]]}
+
+
+def _followings(pk, **kwargs):
+    return {"users": [{"pk": other} for other, f in FOLLOWERS_GRAPH.items() if pk in f]}
+
+
+def _mutual(pk, **kwargs):
+    return {"users": [{"pk": 3 - pk}]}
+
+
+@fixture
+def mock_followers(mocker):
+    return mocker.patch("instapi.client.client.user_followers", side_effect=_followers)
+
+
+@fixture
+def mock_followings(mocker):
+    return mocker.patch("instapi.client.client.user_following", side_effect=_followings)
+
+
+@fixture(params=["memory", "sqlite"])
+def state(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCrawlState()
+
+    return SQLiteCrawlState(tmp_path / "crawl.db")
+
+
+def test_depth_one(mock_followers, state):
+    crawler = GraphCrawler([rand(User, pk=1)], state=state)
+
+    assert [*crawler.iter_edges()] == [Edge(2, 1), Edge(3, 1)]
+
+
+def test_depth_two_dedup(mock_followers, state):
+    crawler = GraphCrawler([1], depth=2, max_workers=2, state=state)
+
+    assert {*crawler.iter_edges()} == {Edge(2, 1), Edge(3, 1), Edge(1, 2), Edge(4, 2), Edge(4, 3)}
+    assert sorted(call[0][0] for call in mock_followers.call_args_list) == [1, 2, 3]
+
+
+def test_followings(mock_followings):
+    crawler = GraphCrawler([4], directions=(FOLLOWINGS,))
+
+    assert {*crawler.iter_edges()} == {Edge(4, 2), Edge(4, 3)}
+
+
+def test_both_directions(mock_followers, mock_followings):
+    crawler = GraphCrawler([3], directions=(FOLLOWERS, FOLLOWINGS))
+
+    assert [*crawler.iter_edges()] == [Edge(4, 3), Edge(3, 1)]
+
+
+def test_both_directions_dedup(mock_followers, mock_followings, state):
+    crawler = GraphCrawler([1], depth=2, directions=(FOLLOWERS, FOLLOWINGS), state=state)
+    edges = [*crawler.iter_edges()]
+
+    assert len(edges) == len({*edges})
+    assert {*edges} == {Edge(2, 1), Edge(3, 1), Edge(1, 2), Edge(4, 2), Edge(4, 3)}
+
+
+def test_mutual_follow(mocker, state):
+    mocker.patch("instapi.client.client.user_followers", side_effect=_mutual)
+    mocker.patch("instapi.client.client.user_following", side_effect=_mutual)
+
+    crawler = GraphCrawler([1], depth=2, directions=(FOLLOWERS, FOLLOWINGS), state=state)
+
+    assert [*crawler.iter_edges()] == [Edge(2, 1), Edge(1, 2)]
+
+
+def test_select_done(state):
+    state.add(range(1_000), 0)
+
+    for pk in range(0, 1_000, 2):
+        state.done(pk)
+
+    assert state.select_done(range(-1, 1_001)) == {*range(0, 1_000, 2)}
+
+
+def test_limit_per_node(mock_followers):
+    crawler = GraphCrawler([1], limit_per_node=1)
+
+    assert [*crawler.iter_edges()] == [Edge(2, 1)]
+
+    _, kwargs = mock_followers.call_args
+    assert kwargs["count"] == 1
+
+
+def test_private_user_skipped(mocker):
+    mocker.patch(
+        "instapi.client.client.user_followers", side_effect=ClientError("Not authorized", 400)
+    )
+
+    assert [*GraphCrawler([1]).iter_edges()] == []
+
+
+def test_unexpected_error(mocker):
+    mocker.patch("instapi.client.client.user_followers", side_effect=ClientError("error", 500))
+
+    with raises(ClientError):
+        [*GraphCrawler([1]).iter_edges()]
+
+
+def test_resume(mock_followers, tmp_path):
+    path = tmp_path / "crawl.db"
+
+    edges = GraphCrawler([1], depth=2, max_workers=1, state=SQLiteCrawlState(path)).iter_edges()
+    assert [next(edges), next(edges)] == [Edge(2, 1), Edge(3, 1)]
+    next(edges)
+    edges.close()
+
+    mock_followers.reset_mock()
+    crawler = GraphCrawler([1], depth=2, max_workers=1, state=SQLiteCrawlState(path))
+
+    assert [*crawler.iter_edges()] == [Edge(1, 2), Edge(4, 2), Edge(4, 3)]
+    assert [call[0][0] for call in mock_followers.call_args_list] == [2, 3]
+
+
+@mark.parametrize("kwargs", [{"depth": 0}, {"directions": ()}, {"directions": ("likes",)}])
+def test_invalid_arguments(kwargs):
+    with raises(ValueError):
+        GraphCrawler([1], **kwargs)
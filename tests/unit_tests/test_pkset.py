@@ -0,0 +1,81 @@
+from pytest import fixture, importorskip, mark
+
+from instapi.pkset import PkSet
+
+
+@fixture(autouse=True, params=["stdlib", "numpy"])
+def backend(request, mocker):
+    if request.param == "numpy":
+        importorskip("numpy")
+    else:
+        mocker.patch("instapi.pkset.np", None)
+
+
+@fixture
+def first():
+    return PkSet([7, 1, 5, 3, 3])
+
+
+@fixture
+def second():
+    return PkSet([5, 6, 7, 8])
+
+
+def test_sorted_unique(first):
+    assert [*first] == [1, 3, 5, 7]
+    assert len(first) == 4
+    assert first.nbytes == 32
+
+
+@mark.parametrize("pk,expected", [[1, True], [7, True], [0, False], [4, False], ["1", False]])
+def test_contains(first, pk, expected):
+    assert (pk in first) is expected
+
+
+def test_intersection(first, second):
+    assert [*first & second] == [5, 7]
+    assert [*first.intersection(second, PkSet([7]))] == [7]
+
+
+def test_union(first, second):
+    assert [*first | second] == [1, 3, 5, 6, 7, 8]
+    assert [*first.union(second, PkSet([0]))] == [0, 1, 3, 5, 6, 7, 8]
+
+
+def test_difference(first, second):
+    assert [*first - second] == [1, 3]
+    assert [*second.difference(first, PkSet([8]))] == [6]
+
+
+def test_from_pages():
+    pages = [{"users": [{"pk": 3}, {"pk": 1}]}, {"users": [{"pk": 2}]}]
+
+    assert [*PkSet.from_pages(pages)] == [1, 2, 3]
+
+
+@mark.parametrize("use_mmap", [False, True])
+def test_save_load(tmp_path, first, second, use_mmap):
+    path = tmp_path / "pks"
+    first.save(path)
+
+    loaded = PkSet.load(path, use_mmap=use_mmap)
+
+    assert loaded == first
+    assert 5 in loaded
+    assert [*loaded & second] == [5, 7]
+
+
+def test_load_empty_mmap(tmp_path):
+    path = tmp_path / "pks"
+    PkSet().save(path)
+
+    assert len(PkSet.load(path, use_mmap=True)) == 0
+
+
+def test_operations_with_empty(first):
+    empty = PkSet()
+
+    assert [*first & empty] == []
+    assert [*first | empty] == [*first]
+    assert [*first - empty] == [*first]
+    assert [*empty - first] == []
@@ -0,0 +1,184 @@
+import asyncio
+from multiprocessing.pool import ThreadPool
+
+from pytest import fixture, mark, raises
+
+from instapi import rate_limit
+from instapi.client_api.base import BaseClient
+from instapi.rate_limit import (
+    DIRECT,
+    FOLLOWS,
+    LIKES,
+    READS,
+    RateLimiter,
+    SQLiteTokenBucket,
+    TokenBucket,
+    disable_rate_limiter,
+    enable_rate_limiter,
+    endpoint_family,
+    per_hour,
+)
+
+
+@fixture
+def mock_time(mocker):
+    return mocker.patch("instapi.rate_limit.time", return_value=0.0)
+
+
+@fixture
+def mock_sleep(mocker):
+    return mocker.patch("instapi.rate_limit.sleep")
+
+
+@fixture
+def limiter():
+    yield enable_rate_limiter({READS: (1, 2)})
+    disable_rate_limiter()
+
+
+@mark.parametrize(
+    "endpoint,family",
+    [
+        ["users/1/info/", READS],
+        ["media/1/likers/", READS],
+        ["media/1/like/", LIKES],
+        ["media/1/unlike/", LIKES],
+        ["media/1/comment_like/", LIKES],
+        ["friendships/create/1/", FOLLOWS],
+        ["friendships/destroy/1/", FOLLOWS],
+        ["friendships/1/followers/", READS],
+        ["direct_v2/threads/broadcast/text/", DIRECT],
+        ["direct_v2/inbox", READS],
+    ],
+)
+def test_endpoint_family(endpoint, family):
+    assert endpoint_family(endpoint) == family
+
+
+def test_per_hour():
+    assert per_hour(7200, burst=3) == (2, 3)
+
+
+class TestTokenBucket:
+    def test_burst(self, mock_time):
+        bucket = TokenBucket(rate=1, capacity=3)
+
+        assert [bucket.reserve() for _ in range(5)] == [0, 0, 0, 1, 2]
+
+    def test_refill(self, mock_time):
+        bucket = TokenBucket(rate=2, capacity=2)
+        bucket.reserve(2)
+
+        mock_time.return_value = 0.5
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0.5
+
+    def test_refill_is_limited_by_capacity(self, mock_time):
+        bucket = TokenBucket(rate=1, capacity=2)
+
+        mock_time.return_value = 100
+
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 1]
+
+    @mark.parametrize("rate,capacity", [[0, 1], [1, 0], [-1, 1]])
+    def test_invalid_args(self, rate, capacity):
+        with raises(ValueError):
+            TokenBucket(rate, capacity)
+
+    def test_threads(self, mock_time):
+        bucket = TokenBucket(rate=1, capacity=1)
+
+        with ThreadPool(10) as pool:
+            delays = pool.map(lambda _: bucket.reserve(), range(100))
+
+        assert sorted(delays) == [*range(100)]
+
+
+class TestSQLiteTokenBucket:
+    def test_shared_state(self, mock_time, tmp_path):
+        path = tmp_path / "limits.sqlite3"
+
+        first = SQLiteTokenBucket(1, 2, path, READS)
+        second = SQLiteTokenBucket(1, 2, path, READS)
+
+        delays = [bucket.reserve() for bucket in (first, second, first, second)]
+
+        assert delays == [0, 0, 1, 2]
+
+    def test_separate_names(self, mock_time, tmp_path):
+        path = tmp_path / "limits.sqlite3"
+
+        first = SQLiteTokenBucket(1, 1, path, READS)
+        second = SQLiteTokenBucket(1, 1, path, LIKES)
+
+        assert [first.reserve(), second.reserve()] == [0, 0]
+
+    def test_limiter_with_path(self, tmp_path):
+        limiter = RateLimiter(path=tmp_path / "limits.sqlite3")
+
+        assert all(isinstance(b, SQLiteTokenBucket) for b in limiter.buckets.values())
+
+
+class TestRateLimiter:
+    def test_default_limits(self):
+        assert {*RateLimiter().buckets} == {READS, LIKES, FOLLOWS, DIRECT}
+
+    def test_acquire(self, mock_time, mock_sleep):
+        limiter = RateLimiter({LIKES: (1, 1)})
+
+        limiter.acquire("media/1/like/")
+        mock_sleep.assert_not_called()
+
+        limiter.acquire("media/2/like/")
+        mock_sleep.assert_called_once_with(1)
+
+    def test_family_without_limit(self, mock_sleep):
+        limiter = RateLimiter()
+        del limiter.buckets[READS]
+
+        for _ in range(100):
+            limiter.acquire("users/1/info/")
+
+        mock_sleep.assert_not_called()
+
+    def test_aacquire(self, mocker, mock_time):
+        mock = mocker.Mock()
+
+        async def fake_sleep(delay):
+            mock(delay)
+
+        mocker.patch("asyncio.sleep", fake_sleep)
+        limiter = RateLimiter({LIKES: (1, 1)})
+
+        async def _acquire():
+            await limiter.aacquire("media/1/like/")
+            await limiter.aacquire("media/2/like/")
+
+        asyncio.run(_acquire())
+
+        mock.assert_called_once_with(1)
+
+
+class TestGlobalRateLimiter:
+    def test_disabled(self, mocker):
+        mock = mocker.patch("instapi.rate_limit.RateLimiter.acquire")
+
+        rate_limit.acquire("users/1/info/")
+
+        mock.assert_not_called()
+
+    def test_enabled(self, mock_time, mock_sleep, limiter):
+        for _ in range(3):
+            rate_limit.acquire("users/1/info/")
+
+        mock_sleep.assert_called_once_with(1)
+
+    def test_client_call_api(self, mocker, limiter):
+        mocker.patch("instagram_private_api.client.Client.__init__", return_value=None)
+        mocker.patch("instagram_private_api.client.Client._call_api", return_value=None)
+        acquire = mocker.patch.object(limiter, "acquire")
+
+        BaseClient("username", "password")._call_api("users/1/info/")
+
+        acquire.assert_called_once_with("users/1/info/")
@@ -0,0 +1,221 @@
+from email.message import Message
+from email.utils import formatdate
+from time import time
+from urllib.error import HTTPError
+
+from instagram_private_api.errors import (
+    ClientConnectionError,
+    ClientError,
+    ClientLoginRequiredError,
+    ClientThrottledError,
+)
+from pytest import fixture, mark, raises
+from requests import Response
+
+from instapi.client_api.base import BaseClient
+from instapi.client_api.direct import DirectEndpoint
+from instapi.retry import (
+    DEFAULT_RETRY_POLICY,
+    RetryPolicy,
+    call_with_retry,
+    get_retry_policy,
+    retry_after,
+    set_retry_policy,
+)
+
+from .conftest import random_string
+
+
+@fixture
+def mock_sleep(mocker):
+    return mocker.patch("instapi.retry.sleep")
+
+
+@fixture
+def policy():
+    return RetryPolicy(max_attempts=3, base_delay=1, max_delay=10, jitter=False)
+
+
+def _http_error(headers):
+    msg = Message()
+    for key, value in headers.items():
+        msg[key] = value
+
+    return HTTPError("http://example.com", 429, "Too Many Requests", msg, None)
+
+
+def _raise_from(cause, error):
+    try:
+        raise cause
+    except type(cause):
+        try:
+            raise error
+        except type(error) as e:
+            return e
+
+
+class TestRetryAfter:
+    def test_no_header(self):
+        assert retry_after(ClientError("error", 429)) is None
+
+    def test_seconds(self):
+        error = _raise_from(_http_error({"Retry-After": "30"}), ClientThrottledError("error", 429))
+
+        assert retry_after(error) == 30
+
+    def test_http_date(self):
+        error = _raise_from(
+            _http_error({"Retry-After": formatdate(time() + 60, usegmt=True)}),
+            ClientThrottledError("error", 429),
+        )
+
+        assert 50 < retry_after(error) <= 60
+
+    def test_invalid_value(self):
+        error = _raise_from(_http_error({"Retry-After": "soon"}), ClientError("error", 429))
+
+        assert retry_after(error) is None
+
+    def test_requests_response(self):
+        response = Response()
+        response.headers["Retry-After"] = "5"
+
+        error = ClientError("error", 429)
+        error.__context__ = type("HTTPError", (Exception,), {"response": response})()
+
+        assert retry_after(error) == 5
+
+
+class TestRetryPolicy:
+    @mark.parametrize(
+        "error,idempotent,expected",
+        [
+            [ClientThrottledError("error", 429), True, True],
+            [ClientThrottledError("error", 429), False, True],
+            [ClientConnectionError("error"), True, True],
+            [ClientConnectionError("error"), False, False],
+            [ClientError("error", 500), True, True],
+            [ClientError("error", 500), False, False],
+            [ClientError("error", 429), False, True],
+            [ClientError("error", 404), True, False],
+            [ClientLoginRequiredError("error", 403), True, False],
+            [ValueError(), True, False],
+        ],
+    )
+    def test_is_retryable(self, policy, error, idempotent, expected):
+        assert policy.is_retryable(error, idempotent) is expected
+
+    def test_exponential_delay(self, policy):
+        assert [policy.delay(attempt) for attempt in range(1, 6)] == [1, 2, 4, 8, 10]
+
+    def test_jitter(self):
+        policy = RetryPolicy(base_delay=4)
+
+        assert all(0 <= policy.delay(2) <= 8 for _ in range(100))
+
+    def test_delay_retry_after(self, policy):
+        error = _raise_from(_http_error({"Retry-After": "30"}), ClientThrottledError("error", 429))
+
+        assert policy.delay(1, error) == 30
+
+    def test_invalid_max_attempts(self):
+        with raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    def test_call_retries(self, mocker, mock_sleep, policy):
+        func = mocker.Mock(
+            side_effect=[ClientConnectionError("error"), ClientError("error", 503), 1]
+        )
+
+        assert policy.call(func, 1, key="value") == 1
+        assert func.call_count == 3
+        assert mock_sleep.call_args_list == [mocker.call(1), mocker.call(2)]
+        func.assert_called_with(1, key="value")
+
+    def test_call_fatal_error(self, mocker, mock_sleep, policy):
+        func = mocker.Mock(side_effect=ClientError("error", 400))
+
+        with raises(ClientError):
+            policy.call(func)
+
+        func.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_call_max_attempts(self, mocker, mock_sleep, policy):
+        func = mocker.Mock(side_effect=ClientConnectionError("error"))
+
+        with raises(ClientConnectionError):
+            policy.call(func)
+
+        assert func.call_count == policy.max_attempts
+
+
+class TestGlobalPolicy:
+    @fixture(autouse=True)
+    def restore_policy(self):
+        yield
+        set_retry_policy(DEFAULT_RETRY_POLICY)
+
+    def test_default_policy(self):
+        assert get_retry_policy() is DEFAULT_RETRY_POLICY
+
+    def test_disabled(self, mocker):
+        set_retry_policy(None)
+        func = mocker.Mock(side_effect=ClientConnectionError("error"))
+
+        with raises(ClientConnectionError):
+            call_with_retry(func)
+
+        func.assert_called_once()
+
+
+class TestClientRetry:
+    @fixture(autouse=True)
+    def set_policy(self, policy):
+        set_retry_policy(policy)
+        yield
+        set_retry_policy(DEFAULT_RETRY_POLICY)
+
+    @fixture
+    def mock_call_api(self, mocker):
+        mocker.patch("instagram_private_api.client.Client.__init__", return_value=None)
+        return mocker.patch("instagram_private_api.client.Client._call_api")
+
+    def test_page_retried_with_same_cursor(self, mock_call_api, mock_sleep):
+        mock_call_api.side_effect = [ClientConnectionError("error"), {"status": "ok"}]
+        client = BaseClient(random_string(), random_string())
+
+        assert client._call_api("feed/", query={"max_id": "cursor"}) == {"status": "ok"}
+
+        first, second = mock_call_api.call_args_list
+        assert first == second
+
+        _, kwargs = second
+        assert kwargs["query"] == {"max_id": "cursor"}
+
+    def test_post_not_retried(self, mock_call_api, mock_sleep):
+        mock_call_api.side_effect = ClientError("error", 500)
+        client = BaseClient(random_string(), random_string())
+
+        with raises(ClientError):
+            client._call_api("media/1/comment/", params={"text": "text"})
+
+        mock_call_api.assert_called_once()
+
+    def test_direct_send_throttled(self, mocker, mock_sleep):
+        mocker.patch("instagram_private_api.client.Client.login", return_value=None)
+        endpoint = DirectEndpoint(random_string(), random_string())
+
+        throttled = Response()
+        throttled.status_code = 429
+        throttled.headers["Retry-After"] = "7"
+
+        ok = Response()
+        ok.status_code = 200
+        ok._content = b'{"status": "ok"}'
+
+        post = mocker.patch("requests.Session.post", side_effect=[throttled, ok])
+
+        assert endpoint.direct_v2_send_text(1, text="text") == {"status": "ok"}
+        assert post.call_count == 2
+        mock_sleep.assert_called_once_with(7)
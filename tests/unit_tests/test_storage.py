@@ -0,0 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from instapi.storage import SQLiteStorage
+
+
+def test_connection_per_thread(tmp_path):
+    storage = SQLiteStorage(tmp_path / "db.sqlite3")
+
+    with ThreadPoolExecutor(1) as pool:
+        other = pool.submit(storage._connection).result()
+
+    assert storage._connection() is storage._connection()
+    assert storage._connection() is not other
+
+
+def test_wal_mode(tmp_path):
+    storage = SQLiteStorage(str(tmp_path / "db.sqlite3"))
+
+    assert storage._connection().execute("PRAGMA journal_mode").fetchone() == ("wal",)
@@ -1,10 +1,23 @@
+import asyncio
+from threading import Barrier, Event
 from typing import Generator, List
 
 from pytest import fixture, mark, raises
 
-from instapi.utils import flat, join, limited, process_many, to_list
+from instapi.utils import (
+    aprocess_many,
+    ato_list,
+    flat,
+    join,
+    limited,
+    page_size_for,
+    parallel_map,
+    prefetch,
+    process_many,
+    to_list,
+)
 
-from .conftest import random_int
+from .conftest import collect, random_int
 
 
 class TestFlat:
@@ -109,6 +122,82 @@ class TestProcessMany:
 
         assert [*process_many(mock)] == max_ids
 
+    def test_process_many_with_page_size(self, mocker):
+        mock = mocker.Mock(side_effect=[{"next_max_id": 1}, {}])
+
+        _ = [*process_many(mock, page_size=10)]
+
+        mock.assert_has_calls([mocker.call(count=10), mocker.call(count=10, max_id=1)])
+
+    def test_process_many_with_page_size_key(self, mocker):
+        mock = mocker.Mock(return_value={})
+
+        _ = [*process_many(mock, page_size=10, page_size_key="page_size")]
+
+        mock.assert_called_once_with(page_size=10)
+
+    def test_aprocess_many_with_page_size(self, mocker):
+        mock = mocker.Mock(return_value={})
+
+        collect(aprocess_many(mock, page_size=10))
+
+        mock.assert_called_once_with(count=10)
+
+
+@mark.parametrize(
+    "limit,expected",
+    [
+        [None, 200],
+        [0, 1],
+        [10, 10],
+        [200, 200],
+        [1_000, 200],
+    ],
+)
+def test_page_size_for(limit, expected):
+    assert page_size_for(limit) == expected
+
+
+class TestParallelMap:
+    def test_parallel_map(self):
+        assert [*parallel_map(lambda x: x * 2, range(100), max_workers=4)] == [
+            x * 2 for x in range(100)
+        ]
+
+    def test_parallel_map_is_concurrent(self):
+        barrier = Barrier(4, timeout=5)
+
+        def func(x):
+            barrier.wait()
+            return x
+
+        assert [*parallel_map(func, range(4), max_workers=4)] == [*range(4)]
+
+    def test_parallel_map_consumes_lazily(self):
+        consumed = []
+
+        def source():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        results = parallel_map(lambda x: x, source(), max_workers=2)
+        next(results)
+        results.close()
+
+        assert len(consumed) < 100
+
+    def test_parallel_map_error(self):
+        def func(x):
+            raise ValueError(x)
+
+        with raises(ValueError):
+            [*parallel_map(func, range(10))]
+
+    def test_parallel_map_invalid_max_workers(self):
+        with raises(ValueError):
+            [*parallel_map(lambda x: x, range(10), max_workers=0)]
+
 
 class TestJoin:
     def test_join_not_str(self):
@@ -119,3 +208,102 @@ class TestJoin:
 
     def test_custom_separator(self):
         assert join(["hello", "world"], " ") == "hello world"
+
+
+class TestPrefetch:
+    """Tests for prefetch function and process_many with prefetch_depth"""
+
+    def test_prefetch_same_items(self):
+        assert [*prefetch(range(100), depth=3)] == [*range(100)]
+
+    def test_prefetch_empty(self):
+        assert [*prefetch([])] == []
+
+    def test_prefetch_invalid_depth(self):
+        with raises(ValueError):
+            prefetch([], depth=0)
+
+    def test_prefetch_error(self):
+        def source():
+            yield 1
+            raise RuntimeError
+
+        iterator = prefetch(source())
+
+        assert next(iterator) == 1
+
+        with raises(RuntimeError):
+            next(iterator)
+
+    def test_prefetch_stopped(self):
+        closed = Event()
+
+        def source():
+            try:
+                yield from range(100)
+            finally:
+                closed.set()
+
+        assert [*limited(prefetch(source()), 2)] == [0, 1]
+        assert closed.wait(timeout=5)
+
+    def test_prefetch_not_started(self, mocker):
+        source = mocker.MagicMock()
+        thread = mocker.patch("instapi.utils.Thread")
+
+        iterator = prefetch(source)
+        del iterator
+
+        thread.assert_not_called()
+        source.__iter__.assert_not_called()
+
+    def test_process_many_with_prefetch(self, mocker):
+        max_ids = [*[{"next_max_id": random_int()} for _ in range(3)], {}]
+        mock = mocker.Mock(side_effect=max_ids)
+
+        assert [*process_many(mock, prefetch_depth=2)] == max_ids
+
+
+class TestAsyncProcessMany:
+    """Tests for aprocess_many and ato_list functions"""
+
+    def test_sync_fetcher(self, mocker):
+        max_ids = [*[{"next_max_id": random_int()} for _ in range(3)], {}]
+        mock = mocker.Mock(side_effect=max_ids)
+
+        assert collect(aprocess_many(mock)) == max_ids
+        mock.assert_has_calls(
+            [
+                mocker.call(),
+                *[mocker.call(max_id=m["next_max_id"]) for m in max_ids[:-1]],
+            ]
+        )
+
+    def test_async_fetcher(self, mocker):
+        max_ids = [*[{"next_max_id": random_int()} for _ in range(3)], {}]
+        mock = mocker.Mock(side_effect=max_ids)
+
+        async def fetcher(*args, **kwargs):
+            return mock(*args, **kwargs)
+
+        pk = random_int()
+        assert collect(aprocess_many(fetcher, pk, with_rank_token=True)) == max_ids
+
+        args, kwargs = mock.call_args
+        assert args == (pk,)
+        assert "rank_token" in kwargs
+
+    @mark.parametrize("limit", [None, 0, 5, 200])
+    def test_ato_list(self, limit):
+        async def source():
+            for i in range(100):
+                yield i
+
+        assert asyncio.run(ato_list(source(), limit)) == to_list(range(100), limit)
+
+    def test_ato_list_negative(self):
+        async def source():
+            yield 1
+
+        with raises(ValueError):
+            asyncio.run(ato_list(source(), -1))